@@ -0,0 +1,38 @@
+"""
+Build the customer index from enquiries submitted before it existed
+
+Enquiries are replayed oldest first. One older than a customer's latest
+enquiry only adds to its count, so running this after deploy never rolls a
+customer back to stale details. Only enquiries without a customer_id are
+touched, so the script is safe to re-run.
+"""
+import asyncio
+import os
+from datetime import datetime, timezone
+
+from server import index_enquiry_customer, repos
+
+BATCH_SIZE = int(os.getenv("MIGRATION_BATCH_SIZE", 500))
+
+async def backfill_customers():
+    for failure in await repos.ensure_indexes():
+        print(f"⚠️  Index build failed: {failure}")
+
+    # Enquiries arriving while the backfill runs are indexed by the API itself
+    started_at = datetime.now(timezone.utc)
+    linked = 0
+    while True:
+        batch = await repos.enquiries.without_customer(started_at, BATCH_SIZE)
+        if not batch:
+            break
+        for doc in batch:
+            customer_id = await index_enquiry_customer(doc)
+            await repos.enquiries.set_customer(doc["enquiry_id"], customer_id)
+            linked += 1
+        print(f"  … {linked} enquiries linked")
+
+    repos.close()
+    print(f"\n✅ Customer index backfill complete ({linked} enquiries)")
+
+if __name__ == "__main__":
+    asyncio.run(backfill_customers())
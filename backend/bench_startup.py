@@ -0,0 +1,127 @@
+"""
+Cold-start benchmark for the API
+
+Reports the `python -X importtime` breakdown of `import server`, which lazy
+integrations ended up loaded, and the time from process spawn to the first
+successful response. Run from the backend directory with the usual .env:
+
+    python bench_startup.py [--top 25] [--path /api/services]
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent
+
+LAZY_MODULES = ["motor", "pymongo", "cloudinary", "resend", "passlib", "jose"]
+
+def import_time_breakdown(top: int):
+    """Return (total_ms, [(cumulative_ms, self_ms, module)]) for `import server`"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import server"],
+        cwd=ROOT_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us) / 1000, int(self_us) / 1000, module.rstrip()))
+
+    server_row = next((row for row in rows if row[2].strip() == "server"), None)
+    total_ms = server_row[0] if server_row else sum(row[1] for row in rows)
+    # Depth 0 is `server` itself, depth 1 its direct imports
+    shallow = [row for row in rows if (len(row[2]) - len(row[2].lstrip()) - 1) // 2 <= 1]
+    return total_ms, sorted(shallow, reverse=True)[:top]
+
+def loaded_lazy_modules():
+    """List which lazily initialised integrations `import server` still pulls in"""
+    code = (
+        "import sys, server; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, capture_output=True, text=True)
+    return [name for name in result.stdout.strip().split(",") if name]
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def wait_for(url: str, deadline: float) -> float:
+    """Poll url until it answers 200, returning the time it first did"""
+    while time.perf_counter() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=2) as response:
+                if response.status == 200:
+                    response.read()
+                    return time.perf_counter()
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass
+        time.sleep(0.02)
+    raise TimeoutError(f"No response from {url}")
+
+def time_to_first_response(path: str, timeout: float):
+    """Spawn uvicorn and time liveness, readiness and the first public read"""
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT_DIR, env=os.environ.copy()
+    )
+    try:
+        deadline = started + timeout
+        live = wait_for(f"{base_url}/health/live", deadline)
+        ready = wait_for(f"{base_url}/health/ready", deadline)
+        request_started = time.perf_counter()
+        first = wait_for(f"{base_url}{path}", deadline)
+        return {
+            "live_ms": (live - started) * 1000,
+            "ready_ms": (ready - started) * 1000,
+            "first_response_ms": (first - started) * 1000,
+            "request_ms": (first - request_started) * 1000,
+        }
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=25, help="number of top-level imports to show")
+    parser.add_argument("--path", default="/api/services", help="public endpoint timed after readiness")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds to wait for the server")
+    parser.add_argument("--skip-server", action="store_true", help="only measure import time")
+    args = parser.parse_args()
+
+    print("⏱  Import time (python -X importtime -c 'import server')")
+    total_ms, rows = import_time_breakdown(args.top)
+    print(f"   {'cumulative':>12} {'self':>10}  module")
+    for cumulative_ms, self_ms, module in rows:
+        print(f"   {cumulative_ms:>10.1f}ms {self_ms:>8.1f}ms  {module.strip()}")
+    print(f"   total: {total_ms:.1f} ms")
+
+    loaded = loaded_lazy_modules()
+    print(f"\n📦 Lazy integrations loaded at import: {', '.join(loaded) if loaded else 'none'}")
+
+    if args.skip_server:
+        return 0
+
+    print(f"\n🚀 Time to first response ({args.path})")
+    timings = time_to_first_response(args.path, args.timeout)
+    print(f"   live:           {timings['live_ms']:.1f} ms")
+    print(f"   ready:          {timings['ready_ms']:.1f} ms")
+    print(f"   first response: {timings['first_response_ms']:.1f} ms (request {timings['request_ms']:.1f} ms)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
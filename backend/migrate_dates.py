@@ -0,0 +1,56 @@
+"""
+Backfill typed BSON datetimes next to the string date fields of events and enquiries
+"""
+import asyncio
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+import os
+from dotenv import load_dotenv
+from pathlib import Path
+
+from server import TYPED_DATE_FIELDS, parse_date
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+BATCH_SIZE = int(os.getenv("MIGRATION_BATCH_SIZE", 500))
+
+COLLECTION_FIELDS = {
+    "events": ["date", "created_at"],
+    "enquiries": ["event_date", "created_at"],
+}
+
+async def backfill_collection(collection, fields):
+    """Set missing typed fields in batches, returning the number of updated documents"""
+    missing = [{TYPED_DATE_FIELDS[field]: {"$exists": False}} for field in fields]
+    projection = {field: 1 for field in fields}
+    cursor = collection.find({"$or": missing}, projection).batch_size(BATCH_SIZE)
+
+    updated = 0
+    batch = []
+    async for doc in cursor:
+        typed = {TYPED_DATE_FIELDS[field]: parse_date(doc.get(field)) for field in fields}
+        batch.append(UpdateOne({"_id": doc["_id"]}, {"$set": typed}))
+        if len(batch) >= BATCH_SIZE:
+            result = await collection.bulk_write(batch, ordered=False)
+            updated += result.modified_count
+            batch = []
+    if batch:
+        result = await collection.bulk_write(batch, ordered=False)
+        updated += result.modified_count
+    return updated
+
+async def migrate_dates():
+    mongo_url = os.environ['MONGO_URL']
+    client = AsyncIOMotorClient(mongo_url)
+    db = client[os.environ['DB_NAME']]
+
+    for name, fields in COLLECTION_FIELDS.items():
+        updated = await backfill_collection(db[name], fields)
+        print(f"✓ {name}: {updated} documents backfilled")
+
+    client.close()
+    print("\n✅ Date migration complete!")
+
+if __name__ == "__main__":
+    asyncio.run(migrate_dates())
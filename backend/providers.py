@@ -0,0 +1,204 @@
+"""
+Lazily initialised third-party integrations
+
+Each provider imports and configures its library on first use, so a process
+that only serves public reads never loads cloudinary, resend, passlib's bcrypt
+backend or python-jose, and importing server.py does not build a Mongo client.
+"""
+import os
+import threading
+from abc import ABC, abstractmethod
+
+
+class InvalidTokenError(Exception):
+    """Raised when a JWT cannot be decoded or verified"""
+
+
+class LazyProvider(ABC):
+    """Builds its backing object on first use and caches it"""
+
+    def __init__(self):
+        self._instance = None
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _create(self):
+        """Import, configure and return the backing object"""
+
+    def get(self):
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._create()
+        return self._instance
+
+    @property
+    def loaded(self) -> bool:
+        return self._instance is not None
+
+
+class PasswordHasher(LazyProvider):
+    """bcrypt password hashing via passlib"""
+
+    def _create(self):
+        from passlib.context import CryptContext
+        return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+    def hash(self, password: str) -> str:
+        return self.get().hash(password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self.get().verify(plain_password, hashed_password)
+
+
+class TokenCodec(LazyProvider):
+    """JWT encoding and decoding via python-jose"""
+
+    def __init__(self, secret: str, algorithm: str):
+        super().__init__()
+        self.secret = secret
+        self.algorithm = algorithm
+
+    def _create(self):
+        from jose import jwt
+        return jwt
+
+    def encode(self, claims: dict) -> str:
+        return self.get().encode(claims, self.secret, algorithm=self.algorithm)
+
+    def decode(self, token: str) -> dict:
+        from jose import JWTError
+        try:
+            return self.get().decode(token, self.secret, algorithms=[self.algorithm])
+        except JWTError as e:
+            raise InvalidTokenError(str(e)) from e
+
+
+class CloudinarySigner(LazyProvider):
+    """Cloudinary configuration and upload request signing"""
+
+    def _create(self):
+        import cloudinary
+        import cloudinary.utils
+        cloudinary.config(
+            cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
+            api_key=os.getenv("CLOUDINARY_API_KEY"),
+            api_secret=os.getenv("CLOUDINARY_API_SECRET"),
+            secure=True
+        )
+        return cloudinary.utils
+
+    def sign(self, params: dict) -> str:
+        return self.get().api_sign_request(params, os.getenv("CLOUDINARY_API_SECRET"))
+
+
+class EmailSender(LazyProvider):
+    """Transactional email via Resend"""
+
+    def _create(self):
+        import resend
+        resend.api_key = os.getenv("RESEND_API_KEY")
+        return resend
+
+    def send(self, params: dict) -> dict:
+        return self.get().Emails.send(params)
+
+
+class PoolStats:
+    """Connection pool counters fed by the Mongo pool listener"""
+
+    def __init__(self):
+        self.open = 0
+        self.checked_out = 0
+        self.created_total = 0
+        self.checkout_failures = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "open_connections": self.open,
+            "checked_out": self.checked_out,
+            "created_total": self.created_total,
+            "checkout_failures": self.checkout_failures,
+        }
+
+
+def _pool_listener(stats: PoolStats):
+    from pymongo import monitoring
+
+    class PoolListener(monitoring.ConnectionPoolListener):
+        def pool_created(self, event):
+            pass
+
+        def pool_ready(self, event):
+            pass
+
+        def pool_cleared(self, event):
+            pass
+
+        def pool_closed(self, event):
+            pass
+
+        def connection_created(self, event):
+            stats.open += 1
+            stats.created_total += 1
+
+        def connection_ready(self, event):
+            pass
+
+        def connection_closed(self, event):
+            stats.open = max(0, stats.open - 1)
+
+        def connection_check_out_started(self, event):
+            pass
+
+        def connection_check_out_failed(self, event):
+            stats.checkout_failures += 1
+
+        def connection_checked_out(self, event):
+            stats.checked_out += 1
+
+        def connection_checked_in(self, event):
+            stats.checked_out = max(0, stats.checked_out - 1)
+
+    return PoolListener()
+
+
+class MongoProvider(LazyProvider):
+    """Motor client created with the configured pool options on first use"""
+
+    def __init__(self, url: str, db_name: str, options: dict):
+        super().__init__()
+        self.url = url
+        self.db_name = db_name
+        self.options = options
+        self.pool_stats = PoolStats()
+
+    def _create(self):
+        from motor.motor_asyncio import AsyncIOMotorClient
+        return AsyncIOMotorClient(self.url, event_listeners=[_pool_listener(self.pool_stats)], **self.options)
+
+    @property
+    def client(self):
+        return self.get()
+
+    @property
+    def db(self):
+        return self.get()[self.db_name]
+
+    def close(self):
+        if self.loaded:
+            self._instance.close()
+            self._instance = None
+
+
+class LazyDatabase:
+    """Stands in for a Motor database so `db.events` works before the client exists"""
+
+    def __init__(self, provider: MongoProvider):
+        self._provider = provider
+
+    def __getattr__(self, name):
+        return getattr(self._provider.db, name)
+
+    def __getitem__(self, name):
+        return self._provider.db[name]
@@ -0,0 +1,1222 @@
+"""
+Data-access layer for the API
+
+Routes talk to repositories instead of raw collections, so projections, indexes
+and result limits live in one place and every call is timed. Two backends share
+the same method contracts: MongoRepositories for production and
+MemoryRepositories, a dependency-free in-process store for local benchmarks and
+tests (select it with DATA_BACKEND=memory).
+"""
+import asyncio
+import copy
+import functools
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from providers import LazyDatabase
+
+# (inclusive start, exclusive end); either bound may be None
+DateRange = Tuple[Optional[datetime], Optional[datetime]]
+
+EVENT_LIST_LIMIT = 1000
+SERVICE_LIST_LIMIT = 100
+ENQUIRY_LIST_LIMIT = 1000
+CONTENT_VERSION_LIST_LIMIT = 100
+ENQUIRY_STATS_MONTHS = 12
+CUSTOMER_LIST_LIMIT = 1000
+
+SHOWCASE_FACETS = ["category", "event_type", "location", "year"]
+
+EVENT_SUMMARY_PROJECTION = {
+    "_id": 0,
+    "event_id": 1,
+    "title": 1,
+    "category": 1,
+    "location": 1,
+    "date": 1,
+    "cover_image": {"$arrayElemAt": ["$images", 0]},
+    "image_count": {"$size": {"$ifNull": ["$images", []]}},
+}
+
+# Extra fields on the admin event list, which shows type and description per card
+ADMIN_EVENT_SUMMARY_FIELDS = ("event_type", "description")
+
+# Trims events to what the showcase filters, sorts and returns before $facet,
+# which cannot use indexes and would otherwise carry descriptions and galleries
+SHOWCASE_PROJECTION = {**EVENT_SUMMARY_PROJECTION, "event_type": 1, "date_dt": 1}
+
+
+class QueryInstrumentation:
+    """Per-call timing hooks plus running totals for each repository operation"""
+
+    def __init__(self):
+        self.hooks: List[Callable[[str, str, float], None]] = []
+        self.stats: Dict[Tuple[str, str], dict] = {}
+
+    def add_hook(self, hook: Callable[[str, str, float], None]):
+        """Register hook(collection, operation, duration_ms), called after every call"""
+        self.hooks.append(hook)
+
+    def record(self, collection: str, operation: str, duration_ms: float):
+        entry = self.stats.setdefault((collection, operation), {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+        entry["calls"] += 1
+        entry["total_ms"] += duration_ms
+        entry["max_ms"] = max(entry["max_ms"], duration_ms)
+        for hook in self.hooks:
+            hook(collection, operation, duration_ms)
+
+    def snapshot(self) -> List[dict]:
+        return [
+            {
+                "collection": collection,
+                "operation": operation,
+                "calls": entry["calls"],
+                "avg_ms": round(entry["total_ms"] / entry["calls"], 3),
+                "max_ms": round(entry["max_ms"], 3),
+            }
+            for (collection, operation), entry in sorted(self.stats.items())
+        ]
+
+    def reset(self):
+        self.stats.clear()
+
+
+def timed(method):
+    """Report the wall time of a repository coroutine to its instrumentation"""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            self.instrumentation.record(self.name, method.__name__, (time.perf_counter() - started) * 1000)
+    return wrapper
+
+
+def _range_query(bounds: Optional[DateRange]) -> Optional[dict]:
+    if bounds is None:
+        return None
+    start, end = bounds
+    query = {}
+    if start is not None:
+        query["$gte"] = start
+    if end is not None:
+        query["$lt"] = end
+    return query or None
+
+
+def _customer_latest(enquiry: dict) -> dict:
+    """Customer fields that always follow the most recent enquiry"""
+    return {
+        "name": enquiry["name"],
+        "phone": enquiry["phone"],
+        "email": enquiry["email"],
+        "latest_enquiry_id": enquiry["enquiry_id"],
+        "latest_status": enquiry["status"],
+        "latest_event_type": enquiry["event_type"],
+        "latest_event_date": enquiry["event_date"],
+        "last_enquiry_at": enquiry["created_at"],
+        "last_enquiry_at_dt": enquiry.get("created_at_dt"),
+    }
+
+
+def _new_customer(customer_id: str, enquiry: dict, phone_key: Optional[str], email_key: Optional[str]) -> dict:
+    customer = {
+        "customer_id": customer_id,
+        "submission_count": 1,
+        "first_enquiry_at": enquiry["created_at"],
+        **_customer_latest(enquiry),
+    }
+    # Keys are only present when set so the sparse unique indexes skip them
+    if phone_key:
+        customer["phone_keys"] = [phone_key]
+    if email_key:
+        customer["email_keys"] = [email_key]
+    return customer
+
+
+def _is_newer(enquiry: dict, customer: dict) -> bool:
+    """Whether an enquiry is more recent than the one the customer currently shows"""
+    created, last = enquiry.get("created_at_dt"), customer.get("last_enquiry_at_dt")
+    return last is None or (created is not None and created > last)
+
+
+def _latest_filter(enquiry: dict) -> dict:
+    """Mongo filter form of _is_newer, guarding the latest-fields update"""
+    created = enquiry.get("created_at_dt")
+    if created is None:
+        return {"last_enquiry_at_dt": None}
+    return {"$or": [{"last_enquiry_at_dt": None}, {"last_enquiry_at_dt": {"$lt": created}}]}
+
+
+def _pick_customer(matches: List[dict], phone_key: Optional[str], email_key: Optional[str]) -> Tuple[dict, dict]:
+    """Choose the customer an enquiry belongs to and the keys it should gain
+
+    A customer matching both keys wins, then one matching the phone. A key held
+    by a different customer is not copied over, so each key maps to one record.
+    """
+    def holds(customer: dict, field: str, key: Optional[str]) -> bool:
+        return key is not None and key in customer.get(field, [])
+
+    matches = sorted(
+        matches,
+        key=lambda customer: (holds(customer, "phone_keys", phone_key) + holds(customer, "email_keys", email_key), holds(customer, "phone_keys", phone_key)),
+        reverse=True
+    )
+    primary = matches[0]
+    new_keys = {}
+    if phone_key and not any(holds(customer, "phone_keys", phone_key) for customer in matches):
+        new_keys["phone_keys"] = phone_key
+    if email_key and not any(holds(customer, "email_keys", email_key) for customer in matches):
+        new_keys["email_keys"] = email_key
+    return primary, new_keys
+
+
+def _content_update(patch: List[dict]) -> Optional[dict]:
+    """Translate json_diff ops into $set/$unset on `content.<path>`
+
+    Returns None when the patch replaces the root or touches a key Mongo cannot
+    address with dot notation; the caller then writes the whole document.
+    """
+    update: Dict[str, dict] = {}
+    for op in patch:
+        tokens = [token.replace("~1", "/").replace("~0", "~") for token in op["path"].split("/")[1:]]
+        if not tokens or any(not token or "." in token or token.startswith("$") for token in tokens):
+            return None
+        field = "content." + ".".join(tokens)
+        if op["op"] == "remove":
+            update.setdefault("$unset", {})[field] = ""
+        else:
+            update.setdefault("$set", {})[field] = op["value"]
+    return update
+
+
+def _year_range(year: int) -> DateRange:
+    return (datetime(year, 1, 1, tzinfo=timezone.utc), datetime(year + 1, 1, 1, tzinfo=timezone.utc))
+
+
+# ---------------------------------------------------------------------------
+# MongoDB backend
+# ---------------------------------------------------------------------------
+
+class MongoRepository:
+    name = ""
+    indexes: List[tuple] = []
+
+    def __init__(self, db, instrumentation: QueryInstrumentation):
+        self.db = db
+        self.instrumentation = instrumentation
+
+    @property
+    def collection(self):
+        return self.db[self.name]
+
+    def index_plan(self) -> List[tuple]:
+        return [(self.collection, keys, options) for keys, options in self.indexes]
+
+    async def ensure_indexes(self) -> List[str]:
+        """Build every index, returning a description of each one that failed
+
+        A failure (e.g. duplicates blocking a unique index) does not stop the
+        remaining indexes from being built.
+        """
+        failures = []
+        for collection, keys, options in self.index_plan():
+            try:
+                await collection.create_index(keys, **options)
+            except Exception as e:
+                failures.append(f"{collection.name} {keys!r}: {str(e)}")
+        return failures
+
+
+class MongoEventRepository(MongoRepository):
+    name = "events"
+    indexes = [
+        ("event_id", {"unique": True}),
+        ([("category", 1), ("date_dt", -1)], {}),
+        ("date_dt", {}),
+    ]
+
+    @staticmethod
+    def _showcase_match(filters: dict, exclude: Optional[str] = None) -> dict:
+        match = {}
+        for field, value in filters.items():
+            if value is None or field == exclude:
+                continue
+            if field == "year":
+                match["date_dt"] = _range_query(_year_range(value))
+            else:
+                match[field] = value
+        return match
+
+    @timed
+    async def list_summaries(
+        self,
+        category: Optional[str] = None,
+        date_range: Optional[DateRange] = None,
+        extra_fields: Tuple[str, ...] = ()
+    ) -> List[dict]:
+        match = {}
+        if category:
+            match["category"] = category
+        date_query = _range_query(date_range)
+        if date_query:
+            match["date_dt"] = date_query
+
+        pipeline = []
+        if match:
+            pipeline.append({"$match": match})
+        pipeline.append({"$sort": {"date_dt": -1}})
+        # Bounds the server-side sort; to_list alone only caps what is returned
+        pipeline.append({"$limit": EVENT_LIST_LIMIT})
+        pipeline.append({"$project": {**EVENT_SUMMARY_PROJECTION, **{field: 1 for field in extra_fields}}})
+        return await self.collection.aggregate(pipeline).to_list(EVENT_LIST_LIMIT)
+
+    @timed
+    async def showcase(self, filters: dict, skip: int, limit: int) -> dict:
+        # Each facet is counted against the other active filters, so selecting a
+        # category still shows the counts for its sibling categories
+        facet_expressions = {
+            "category": "$category",
+            "event_type": "$event_type",
+            "location": "$location",
+            "year": {"$year": "$date_dt"},
+        }
+        facet_stages = {
+            "events": [
+                {"$match": self._showcase_match(filters)},
+                {"$sort": {"date_dt": -1}},
+                {"$skip": skip},
+                {"$limit": limit},
+                {"$project": {"event_type": 0, "date_dt": 0}},
+            ],
+            "total": [
+                {"$match": self._showcase_match(filters)},
+                {"$count": "count"},
+            ],
+        }
+        for facet in SHOWCASE_FACETS:
+            facet_stages[facet] = [
+                {"$match": self._showcase_match(filters, exclude=facet)},
+                {"$group": {"_id": facet_expressions[facet], "count": {"$sum": 1}}},
+                {"$match": {"_id": {"$ne": None}}},
+                {"$sort": {"count": -1, "_id": 1}},
+                {"$project": {"_id": 0, "value": "$_id", "count": 1}},
+            ]
+
+        results = await self.collection.aggregate([
+            {"$project": SHOWCASE_PROJECTION},
+            {"$facet": facet_stages},
+        ]).to_list(1)
+        result = results[0] if results else {}
+        total = result.get("total") or [{"count": 0}]
+        return {
+            "events": result.get("events", []),
+            "total": total[0]["count"],
+            "facets": {facet: result.get(facet, []) for facet in SHOWCASE_FACETS},
+        }
+
+    @timed
+    async def get(self, event_id: str) -> Optional[dict]:
+        return await self.collection.find_one({"event_id": event_id}, {"_id": 0})
+
+    @timed
+    async def insert(self, doc: dict):
+        await self.collection.insert_one(copy.copy(doc))
+
+    @timed
+    async def update(self, event_id: str, fields: dict) -> bool:
+        result = await self.collection.update_one({"event_id": event_id}, {"$set": fields})
+        return result.matched_count > 0
+
+    @timed
+    async def push_images(self, event_id: str, urls: List[str]) -> bool:
+        result = await self.collection.update_one({"event_id": event_id}, {"$push": {"images": {"$each": urls}}})
+        return result.matched_count > 0
+
+    @timed
+    async def delete(self, event_id: str) -> bool:
+        result = await self.collection.delete_one({"event_id": event_id})
+        return result.deleted_count > 0
+
+
+class MongoServiceRepository(MongoRepository):
+    name = "services"
+    indexes = [("service_id", {"unique": True})]
+
+    @timed
+    async def list(self) -> List[dict]:
+        return await self.collection.find({}, {"_id": 0}).to_list(SERVICE_LIST_LIMIT)
+
+    @timed
+    async def get(self, service_id: str) -> Optional[dict]:
+        return await self.collection.find_one({"service_id": service_id}, {"_id": 0})
+
+    @timed
+    async def insert(self, doc: dict):
+        await self.collection.insert_one(copy.copy(doc))
+
+    @timed
+    async def update(self, service_id: str, fields: dict) -> bool:
+        result = await self.collection.update_one({"service_id": service_id}, {"$set": fields})
+        return result.matched_count > 0
+
+
+class MongoEnquiryRepository(MongoRepository):
+    name = "enquiries"
+    indexes = [
+        ("enquiry_id", {"unique": True}),
+        ("created_at_dt", {}),
+        ("event_date_dt", {}),
+        ("customer_id", {}),
+    ]
+
+    @timed
+    async def insert(self, doc: dict):
+        await self.collection.insert_one(copy.copy(doc))
+
+    @timed
+    async def list_for_customer(self, customer_id: str) -> List[dict]:
+        return await self.collection.find({"customer_id": customer_id}, {"_id": 0}).sort("created_at_dt", -1).to_list(ENQUIRY_LIST_LIMIT)
+
+    @timed
+    async def without_customer(self, created_before: datetime, limit: int) -> List[dict]:
+        """Oldest enquiries not yet linked to a customer, for the index backfill
+
+        Enquiries submitted after `created_before` are left to create_enquiry,
+        which links them itself.
+        """
+        query = {
+            "customer_id": None,
+            "$or": [{"created_at_dt": None}, {"created_at_dt": {"$lt": created_before}}],
+        }
+        return await self.collection.find(query, {"_id": 0}).sort("created_at_dt", 1).to_list(limit)
+
+    @timed
+    async def set_customer(self, enquiry_id: str, customer_id: str) -> bool:
+        result = await self.collection.update_one({"enquiry_id": enquiry_id}, {"$set": {"customer_id": customer_id}})
+        return result.matched_count > 0
+
+    @timed
+    async def list(self, event_date_range: Optional[DateRange] = None, created_range: Optional[DateRange] = None) -> List[dict]:
+        query = {}
+        event_date_query = _range_query(event_date_range)
+        if event_date_query:
+            query["event_date_dt"] = event_date_query
+        created_query = _range_query(created_range)
+        if created_query:
+            query["created_at_dt"] = created_query
+        return await self.collection.find(query, {"_id": 0}).sort("created_at_dt", -1).to_list(ENQUIRY_LIST_LIMIT)
+
+    @timed
+    async def update_status(self, enquiry_id: str, status: str) -> bool:
+        result = await self.collection.update_one({"enquiry_id": enquiry_id}, {"$set": {"status": status}})
+        return result.matched_count > 0
+
+    @timed
+    async def stats(self) -> dict:
+        """Totals by status and by submission month (most recent months first)"""
+        results = await self.collection.aggregate([{"$facet": {
+            "total": [{"$count": "count"}],
+            "by_status": [{"$group": {"_id": "$status", "count": {"$sum": 1}}}],
+            "by_month": [
+                {"$match": {"created_at_dt": {"$ne": None}}},
+                {"$group": {"_id": {"$dateToString": {"format": "%Y-%m", "date": "$created_at_dt"}}, "count": {"$sum": 1}}},
+                {"$sort": {"_id": -1}},
+                {"$limit": ENQUIRY_STATS_MONTHS},
+            ],
+        }}]).to_list(1)
+        result = results[0] if results else {}
+        total = result.get("total") or [{"count": 0}]
+        return {
+            "total": total[0]["count"],
+            "by_status": {row["_id"]: row["count"] for row in result.get("by_status", [])},
+            "by_month": [{"month": row["_id"], "count": row["count"]} for row in result.get("by_month", [])],
+        }
+
+
+class MongoCustomerRepository(MongoRepository):
+    """Customer index grouping enquiries by normalised phone number and email
+
+    Maintained incrementally as enquiries arrive, so the grouped enquiry view
+    reads one small document per customer instead of grouping every enquiry.
+    """
+
+    name = "customers"
+    indexes = [
+        ("customer_id", {"unique": True}),
+        ("phone_keys", {"unique": True, "sparse": True}),
+        ("email_keys", {"unique": True, "sparse": True}),
+        ("latest_enquiry_id", {}),
+        ([("latest_status", 1), ("last_enquiry_at_dt", -1)], {}),
+        ("last_enquiry_at_dt", {}),
+    ]
+    summary_projection = {"_id": 0, "phone_keys": 0, "email_keys": 0, "last_enquiry_at_dt": 0}
+
+    @timed
+    async def record_enquiry(self, enquiry: dict, phone_key: Optional[str], email_key: Optional[str]) -> str:
+        """Count an enquiry against its customer, creating one if none matches; returns customer_id"""
+        from pymongo.errors import DuplicateKeyError
+
+        keys = [{field: key} for field, key in (("phone_keys", phone_key), ("email_keys", email_key)) if key]
+        for attempt in range(2):
+            matches = []
+            if keys:
+                matches = await self.collection.find(
+                    {"$or": keys}, {"_id": 0, "customer_id": 1, "phone_keys": 1, "email_keys": 1}
+                ).to_list(2)
+            try:
+                if not matches:
+                    customer = _new_customer(str(uuid.uuid4()), enquiry, phone_key, email_key)
+                    await self.collection.insert_one(customer)
+                    return customer["customer_id"]
+
+                primary, new_keys = _pick_customer(matches, phone_key, email_key)
+                update = {"$inc": {"submission_count": 1}, "$min": {"first_enquiry_at": enquiry["created_at"]}}
+                if new_keys:
+                    update["$addToSet"] = new_keys
+                await self.collection.update_one({"customer_id": primary["customer_id"]}, update)
+                # Older enquiries (e.g. replayed by the backfill) only count, they never become the latest
+                await self.collection.update_one(
+                    {"customer_id": primary["customer_id"], **_latest_filter(enquiry)},
+                    {"$set": _customer_latest(enquiry)}
+                )
+                return primary["customer_id"]
+            except DuplicateKeyError:
+                # A concurrent submission claimed one of the keys first; match against it
+                if attempt:
+                    raise
+
+    @timed
+    async def list(self, status: Optional[str] = None, skip: int = 0, limit: int = CUSTOMER_LIST_LIMIT) -> List[dict]:
+        query = {"latest_status": status} if status else {}
+        cursor = self.collection.find(query, self.summary_projection).sort("last_enquiry_at_dt", -1)
+        return await cursor.skip(skip).limit(limit).to_list(limit)
+
+    @timed
+    async def get(self, customer_id: str) -> Optional[dict]:
+        return await self.collection.find_one({"customer_id": customer_id}, self.summary_projection)
+
+    @timed
+    async def update_status(self, enquiry_id: str, status: str):
+        """Mirror a status change when it is the customer's latest enquiry"""
+        await self.collection.update_one({"latest_enquiry_id": enquiry_id}, {"$set": {"latest_status": status}})
+
+
+class MongoContentRepository(MongoRepository):
+    name = "content"
+    indexes = [("section_name", {"unique": True})]
+
+    @property
+    def versions(self):
+        return self.db["content_versions"]
+
+    def index_plan(self) -> List[tuple]:
+        return super().index_plan() + [(self.versions, [("section_name", 1), ("version", -1)], {"unique": True})]
+
+    @timed
+    async def get(self, section_name: str) -> Optional[dict]:
+        return await self.collection.find_one({"section_name": section_name}, {"_id": 0})
+
+    @timed
+    async def save_version(self, current: Optional[dict], content: dict, version_record: dict) -> bool:
+        """Write content as version_record["version"] if the section still matches current
+
+        The content write is the compare-and-swap: new sections are inserted
+        against the unique section_name index and existing ones are updated
+        only at the version they were read at, so exactly one writer gets each
+        version and its history record.
+        """
+        from pymongo.errors import DuplicateKeyError
+
+        section_name = version_record["section_name"]
+        if current is None:
+            try:
+                await self.collection.insert_one({"section_name": section_name, "content": content, "version": version_record["version"]})
+            except DuplicateKeyError:
+                return False
+        else:
+            version_filter = {"section_name": section_name, "version": current["version"] if "version" in current else {"$exists": False}}
+            # Write only the changed paths; the version filter guarantees the patch
+            # applies to exactly the content it was computed from
+            update = _content_update(version_record["patch"]) or {"$set": {"content": content}}
+            update.setdefault("$set", {})["version"] = version_record["version"]
+            result = await self.collection.update_one(version_filter, update)
+            if result.matched_count == 0:
+                return False
+
+        await self.versions.insert_one(copy.copy(version_record))
+        return True
+
+    @timed
+    async def list_versions(self, section_name: str) -> List[dict]:
+        return await self.versions.find(
+            {"section_name": section_name},
+            {"_id": 0, "revert": 0}
+        ).sort("version", -1).to_list(CONTENT_VERSION_LIST_LIMIT)
+
+    @timed
+    async def revert_history(self, section_name: str, after_version: int, up_to_version: int) -> List[dict]:
+        """Revert diffs for versions in (after_version, up_to_version], newest first"""
+        return await self.versions.find(
+            {"section_name": section_name, "version": {"$gt": after_version, "$lte": up_to_version}},
+            {"_id": 0, "version": 1, "revert": 1}
+        ).sort("version", -1).to_list(None)
+
+
+class MongoAdminRepository(MongoRepository):
+    name = "admins"
+    indexes = [("email", {"unique": True})]
+
+    @timed
+    async def count(self) -> int:
+        return await self.collection.count_documents({})
+
+    @timed
+    async def get_by_email(self, email: str) -> Optional[dict]:
+        return await self.collection.find_one({"email": email}, {"_id": 0})
+
+    @timed
+    async def insert(self, doc: dict):
+        await self.collection.insert_one(copy.copy(doc))
+
+
+class MongoUploadSessionRepository(MongoRepository):
+    name = "upload_sessions"
+    indexes = [
+        ("session_id", {"unique": True}),
+        ("expires_at", {"expireAfterSeconds": 0}),
+    ]
+
+    @timed
+    async def insert(self, doc: dict):
+        await self.collection.insert_one(copy.copy(doc))
+
+    @timed
+    async def get(self, session_id: str) -> Optional[dict]:
+        # The TTL monitor only runs periodically, so filter expired sessions too
+        return await self.collection.find_one(
+            {"session_id": session_id, "expires_at": {"$gt": datetime.now(timezone.utc)}},
+            {"_id": 0}
+        )
+
+    @timed
+    async def claim(self, session_id: str, fields: dict) -> bool:
+        """Move an open session to completed; False if it was already claimed"""
+        result = await self.collection.update_one(
+            {"session_id": session_id, "status": "open"},
+            {"$set": {**fields, "status": "completed"}}
+        )
+        return result.modified_count > 0
+
+    @timed
+    async def reopen(self, session_id: str):
+        await self.collection.update_one({"session_id": session_id}, {"$set": {"status": "open"}})
+
+    @timed
+    async def purge_expired(self) -> int:
+        result = await self.collection.delete_many({"expires_at": {"$lte": datetime.now(timezone.utc)}})
+        return result.deleted_count
+
+
+class MongoNotificationRepository(MongoRepository):
+    """Outbox of notification emails that failed and are waiting to be retried"""
+
+    name = "email_outbox"
+    indexes = [
+        ("notification_id", {"unique": True}),
+        ([("status", 1), ("next_attempt_at", 1)], {}),
+    ]
+
+    @timed
+    async def insert(self, doc: dict):
+        await self.collection.insert_one(copy.copy(doc))
+
+    @timed
+    async def due(self, now: datetime, limit: int) -> List[dict]:
+        return await self.collection.find(
+            {"status": "pending", "next_attempt_at": {"$lte": now}},
+            {"_id": 0}
+        ).sort("next_attempt_at", 1).to_list(limit)
+
+    @timed
+    async def update(self, notification_id: str, fields: dict) -> bool:
+        result = await self.collection.update_one({"notification_id": notification_id}, {"$set": fields})
+        return result.matched_count > 0
+
+    @timed
+    async def purge(self, before: datetime) -> int:
+        """Delete sent or abandoned notifications last touched before the cutoff"""
+        result = await self.collection.delete_many({"status": {"$in": ["sent", "failed"]}, "updated_at": {"$lt": before}})
+        return result.deleted_count
+
+
+class MongoLeaseRepository(MongoRepository):
+    """Expiring lease documents used for single-leader election across workers"""
+
+    name = "leases"
+
+    @timed
+    async def acquire(self, name: str, holder: str, ttl_seconds: float) -> bool:
+        """Take or renew the lease; False while another holder's lease is live"""
+        from pymongo.errors import DuplicateKeyError
+
+        now = datetime.now(timezone.utc)
+        try:
+            # The upsert collides on _id when someone else holds a live lease
+            await self.collection.update_one(
+                {"_id": name, "$or": [{"holder": holder}, {"expires_at": {"$lte": now}}]},
+                {"$set": {"holder": holder, "expires_at": now + timedelta(seconds=ttl_seconds)}},
+                upsert=True
+            )
+        except DuplicateKeyError:
+            return False
+        return True
+
+    @timed
+    async def release(self, name: str, holder: str):
+        await self.collection.delete_one({"_id": name, "holder": holder})
+
+
+class MongoRepositories:
+    backend = "mongo"
+
+    def __init__(self, provider, instrumentation: Optional[QueryInstrumentation] = None):
+        self.provider = provider
+        self.instrumentation = instrumentation or QueryInstrumentation()
+        db = LazyDatabase(provider)
+        self.events = MongoEventRepository(db, self.instrumentation)
+        self.services = MongoServiceRepository(db, self.instrumentation)
+        self.enquiries = MongoEnquiryRepository(db, self.instrumentation)
+        self.customers = MongoCustomerRepository(db, self.instrumentation)
+        self.content = MongoContentRepository(db, self.instrumentation)
+        self.admins = MongoAdminRepository(db, self.instrumentation)
+        self.uploads = MongoUploadSessionRepository(db, self.instrumentation)
+        self.notifications = MongoNotificationRepository(db, self.instrumentation)
+        self.leases = MongoLeaseRepository(db, self.instrumentation)
+
+    def all(self) -> list:
+        return [
+            self.events, self.services, self.enquiries, self.customers, self.content,
+            self.admins, self.uploads, self.notifications, self.leases,
+        ]
+
+    async def ensure_indexes(self) -> List[str]:
+        failures = []
+        for repository in self.all():
+            failures.extend(await repository.ensure_indexes())
+        return failures
+
+    async def ping(self):
+        await self.provider.client.admin.command("ping")
+
+    async def warm_pool(self, connections: int):
+        """Concurrent pings force the pool up to the given number of connections"""
+        await asyncio.gather(*(self.ping() for _ in range(connections)))
+
+    def pool_state(self) -> dict:
+        return {
+            "backend": self.backend,
+            "max_size": self.provider.options.get("maxPoolSize"),
+            "min_size": self.provider.options.get("minPoolSize"),
+            **self.provider.pool_stats.snapshot()
+        }
+
+    def close(self):
+        self.provider.close()
+
+
+# ---------------------------------------------------------------------------
+# In-memory backend
+# ---------------------------------------------------------------------------
+
+class DuplicateRecordError(Exception):
+    """Raised by the in-memory backend where Mongo would raise DuplicateKeyError"""
+
+
+def _date_sort_key(doc: dict, field: str):
+    value = doc.get(field)
+    return (value is not None, value or datetime.min.replace(tzinfo=timezone.utc))
+
+
+def _in_range(value: Optional[datetime], bounds: Optional[DateRange]) -> bool:
+    if bounds is None:
+        return True
+    start, end = bounds
+    if start is None and end is None:
+        return True
+    if value is None:
+        return False
+    if start is not None and value < start:
+        return False
+    if end is not None and value >= end:
+        return False
+    return True
+
+
+def _event_summary(doc: dict, extra_fields: Tuple[str, ...] = ()) -> dict:
+    images = doc.get("images") or []
+    fields = ("event_id", "title", "category", "location", "date") + tuple(extra_fields)
+    summary = {key: doc[key] for key in fields if key in doc}
+    if images:
+        summary["cover_image"] = images[0]
+    summary["image_count"] = len(images)
+    return summary
+
+
+class MemoryRepository:
+    name = ""
+    key = ""
+
+    def __init__(self, instrumentation: QueryInstrumentation):
+        self.instrumentation = instrumentation
+        self.records: Dict[str, dict] = {}
+
+    async def ensure_indexes(self) -> List[str]:
+        return []
+
+    def _insert(self, doc: dict):
+        if doc[self.key] in self.records:
+            raise DuplicateRecordError(f"{self.name}.{self.key} {doc[self.key]!r} already exists")
+        self.records[doc[self.key]] = copy.deepcopy(doc)
+
+    def _get(self, key: str) -> Optional[dict]:
+        record = self.records.get(key)
+        return copy.deepcopy(record) if record is not None else None
+
+    def _update(self, key: str, fields: dict) -> bool:
+        record = self.records.get(key)
+        if record is None:
+            return False
+        record.update(copy.deepcopy(fields))
+        return True
+
+
+class MemoryEventRepository(MemoryRepository):
+    name = "events"
+    key = "event_id"
+
+    def _sorted(self, docs: List[dict]) -> List[dict]:
+        return sorted(docs, key=lambda doc: _date_sort_key(doc, "date_dt"), reverse=True)
+
+    @staticmethod
+    def _showcase_matches(doc: dict, filters: dict, exclude: Optional[str] = None) -> bool:
+        for field, value in filters.items():
+            if value is None or field == exclude:
+                continue
+            if field == "year":
+                if not _in_range(doc.get("date_dt"), _year_range(value)):
+                    return False
+            elif doc.get(field) != value:
+                return False
+        return True
+
+    @staticmethod
+    def _facet_value(doc: dict, facet: str):
+        if facet == "year":
+            date_dt = doc.get("date_dt")
+            return date_dt.year if date_dt is not None else None
+        return doc.get(facet)
+
+    @timed
+    async def list_summaries(
+        self,
+        category: Optional[str] = None,
+        date_range: Optional[DateRange] = None,
+        extra_fields: Tuple[str, ...] = ()
+    ) -> List[dict]:
+        docs = [
+            doc for doc in self.records.values()
+            if (not category or doc.get("category") == category) and _in_range(doc.get("date_dt"), date_range)
+        ]
+        return [_event_summary(doc, extra_fields) for doc in self._sorted(docs)[:EVENT_LIST_LIMIT]]
+
+    @timed
+    async def showcase(self, filters: dict, skip: int, limit: int) -> dict:
+        docs = list(self.records.values())
+        matching = self._sorted([doc for doc in docs if self._showcase_matches(doc, filters)])
+
+        facets = {}
+        for facet in SHOWCASE_FACETS:
+            counts = Counter(
+                self._facet_value(doc, facet) for doc in docs
+                if self._showcase_matches(doc, filters, exclude=facet)
+            )
+            counts.pop(None, None)
+            facets[facet] = [
+                {"value": value, "count": count}
+                for value, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+            ]
+
+        return {
+            "events": [_event_summary(doc) for doc in matching[skip:skip + limit]],
+            "total": len(matching),
+            "facets": facets,
+        }
+
+    @timed
+    async def get(self, event_id: str) -> Optional[dict]:
+        return self._get(event_id)
+
+    @timed
+    async def insert(self, doc: dict):
+        self._insert(doc)
+
+    @timed
+    async def update(self, event_id: str, fields: dict) -> bool:
+        return self._update(event_id, fields)
+
+    @timed
+    async def push_images(self, event_id: str, urls: List[str]) -> bool:
+        record = self.records.get(event_id)
+        if record is None:
+            return False
+        record.setdefault("images", []).extend(urls)
+        return True
+
+    @timed
+    async def delete(self, event_id: str) -> bool:
+        return self.records.pop(event_id, None) is not None
+
+
+class MemoryServiceRepository(MemoryRepository):
+    name = "services"
+    key = "service_id"
+
+    @timed
+    async def list(self) -> List[dict]:
+        return [copy.deepcopy(doc) for doc in list(self.records.values())[:SERVICE_LIST_LIMIT]]
+
+    @timed
+    async def get(self, service_id: str) -> Optional[dict]:
+        return self._get(service_id)
+
+    @timed
+    async def insert(self, doc: dict):
+        self._insert(doc)
+
+    @timed
+    async def update(self, service_id: str, fields: dict) -> bool:
+        return self._update(service_id, fields)
+
+
+class MemoryEnquiryRepository(MemoryRepository):
+    name = "enquiries"
+    key = "enquiry_id"
+
+    @timed
+    async def insert(self, doc: dict):
+        self._insert(doc)
+
+    @timed
+    async def list_for_customer(self, customer_id: str) -> List[dict]:
+        docs = [doc for doc in self.records.values() if doc.get("customer_id") == customer_id]
+        docs.sort(key=lambda doc: _date_sort_key(doc, "created_at_dt"), reverse=True)
+        return [copy.deepcopy(doc) for doc in docs[:ENQUIRY_LIST_LIMIT]]
+
+    @timed
+    async def without_customer(self, created_before: datetime, limit: int) -> List[dict]:
+        docs = [
+            doc for doc in self.records.values()
+            if doc.get("customer_id") is None and (doc.get("created_at_dt") is None or doc["created_at_dt"] < created_before)
+        ]
+        docs.sort(key=lambda doc: _date_sort_key(doc, "created_at_dt"))
+        return [copy.deepcopy(doc) for doc in docs[:limit]]
+
+    @timed
+    async def set_customer(self, enquiry_id: str, customer_id: str) -> bool:
+        return self._update(enquiry_id, {"customer_id": customer_id})
+
+    @timed
+    async def list(self, event_date_range: Optional[DateRange] = None, created_range: Optional[DateRange] = None) -> List[dict]:
+        docs = [
+            doc for doc in self.records.values()
+            if _in_range(doc.get("event_date_dt"), event_date_range) and _in_range(doc.get("created_at_dt"), created_range)
+        ]
+        docs.sort(key=lambda doc: _date_sort_key(doc, "created_at_dt"), reverse=True)
+        return [copy.deepcopy(doc) for doc in docs[:ENQUIRY_LIST_LIMIT]]
+
+    @timed
+    async def update_status(self, enquiry_id: str, status: str) -> bool:
+        return self._update(enquiry_id, {"status": status})
+
+    @timed
+    async def stats(self) -> dict:
+        docs = list(self.records.values())
+        by_month = Counter(
+            doc["created_at_dt"].strftime("%Y-%m") for doc in docs
+            if doc.get("created_at_dt") is not None
+        )
+        return {
+            "total": len(docs),
+            "by_status": dict(Counter(doc.get("status") for doc in docs)),
+            "by_month": [
+                {"month": month, "count": by_month[month]}
+                for month in sorted(by_month, reverse=True)[:ENQUIRY_STATS_MONTHS]
+            ],
+        }
+
+
+class MemoryCustomerRepository(MemoryRepository):
+    name = "customers"
+    key = "customer_id"
+
+    def __init__(self, instrumentation: QueryInstrumentation):
+        super().__init__(instrumentation)
+        self.key_index: Dict[Tuple[str, str], str] = {}
+        self.latest_index: Dict[str, str] = {}
+
+    @staticmethod
+    def _summary(doc: dict) -> dict:
+        return {key: copy.deepcopy(value) for key, value in doc.items() if key not in ("phone_keys", "email_keys", "last_enquiry_at_dt")}
+
+    def _index(self, customer: dict):
+        for field in ("phone_keys", "email_keys"):
+            for key in customer.get(field, []):
+                self.key_index[(field, key)] = customer["customer_id"]
+        self.latest_index[customer["latest_enquiry_id"]] = customer["customer_id"]
+
+    @timed
+    async def record_enquiry(self, enquiry: dict, phone_key: Optional[str], email_key: Optional[str]) -> str:
+        matched_ids = {
+            self.key_index[(field, key)]
+            for field, key in (("phone_keys", phone_key), ("email_keys", email_key))
+            if key and (field, key) in self.key_index
+        }
+        if not matched_ids:
+            customer = _new_customer(str(uuid.uuid4()), enquiry, phone_key, email_key)
+            self._insert(customer)
+            self._index(customer)
+            return customer["customer_id"]
+
+        primary, new_keys = _pick_customer([self.records[customer_id] for customer_id in matched_ids], phone_key, email_key)
+        customer = self.records[primary["customer_id"]]
+        customer["submission_count"] += 1
+        customer["first_enquiry_at"] = min(customer["first_enquiry_at"], enquiry["created_at"])
+        if _is_newer(enquiry, customer):
+            self.latest_index.pop(customer["latest_enquiry_id"], None)
+            customer.update(_customer_latest(enquiry))
+        for field, key in new_keys.items():
+            customer.setdefault(field, []).append(key)
+        self._index(customer)
+        return customer["customer_id"]
+
+    @timed
+    async def list(self, status: Optional[str] = None, skip: int = 0, limit: int = CUSTOMER_LIST_LIMIT) -> List[dict]:
+        docs = [doc for doc in self.records.values() if not status or doc["latest_status"] == status]
+        docs.sort(key=lambda doc: _date_sort_key(doc, "last_enquiry_at_dt"), reverse=True)
+        return [self._summary(doc) for doc in docs[skip:skip + limit]]
+
+    @timed
+    async def get(self, customer_id: str) -> Optional[dict]:
+        customer = self.records.get(customer_id)
+        return self._summary(customer) if customer is not None else None
+
+    @timed
+    async def update_status(self, enquiry_id: str, status: str):
+        customer_id = self.latest_index.get(enquiry_id)
+        if customer_id is not None:
+            self.records[customer_id]["latest_status"] = status
+
+
+class MemoryContentRepository(MemoryRepository):
+    name = "content"
+    key = "section_name"
+
+    def __init__(self, instrumentation: QueryInstrumentation):
+        super().__init__(instrumentation)
+        self.versions: Dict[str, Dict[int, dict]] = {}
+
+    @timed
+    async def get(self, section_name: str) -> Optional[dict]:
+        return self._get(section_name)
+
+    @timed
+    async def save_version(self, current: Optional[dict], content: dict, version_record: dict) -> bool:
+        section_name = version_record["section_name"]
+        stored = self.records.get(section_name)
+        if current is None:
+            if stored is not None:
+                return False
+        elif stored is None or stored.get("version") != current.get("version"):
+            return False
+
+        history = self.versions.setdefault(section_name, {})
+        if version_record["version"] in history:
+            return False
+
+        self.records[section_name] = {
+            **(stored or {"section_name": section_name}),
+            "content": copy.deepcopy(content),
+            "version": version_record["version"],
+        }
+        history[version_record["version"]] = copy.deepcopy(version_record)
+        return True
+
+    @timed
+    async def list_versions(self, section_name: str) -> List[dict]:
+        history = self.versions.get(section_name, {})
+        return [
+            {key: copy.deepcopy(value) for key, value in history[version].items() if key != "revert"}
+            for version in sorted(history, reverse=True)[:CONTENT_VERSION_LIST_LIMIT]
+        ]
+
+    @timed
+    async def revert_history(self, section_name: str, after_version: int, up_to_version: int) -> List[dict]:
+        history = self.versions.get(section_name, {})
+        return [
+            {"version": version, "revert": copy.deepcopy(history[version]["revert"])}
+            for version in sorted(history, reverse=True)
+            if after_version < version <= up_to_version
+        ]
+
+
+class MemoryAdminRepository(MemoryRepository):
+    name = "admins"
+    key = "email"
+
+    @timed
+    async def count(self) -> int:
+        return len(self.records)
+
+    @timed
+    async def get_by_email(self, email: str) -> Optional[dict]:
+        return self._get(email)
+
+    @timed
+    async def insert(self, doc: dict):
+        self._insert(doc)
+
+
+class MemoryUploadSessionRepository(MemoryRepository):
+    name = "upload_sessions"
+    key = "session_id"
+
+    def _live(self, session_id: str) -> Optional[dict]:
+        record = self.records.get(session_id)
+        if record is None or record["expires_at"] <= datetime.now(timezone.utc):
+            self.records.pop(session_id, None)
+            return None
+        return record
+
+    @timed
+    async def insert(self, doc: dict):
+        self._insert(doc)
+
+    @timed
+    async def get(self, session_id: str) -> Optional[dict]:
+        record = self._live(session_id)
+        return copy.deepcopy(record) if record is not None else None
+
+    @timed
+    async def claim(self, session_id: str, fields: dict) -> bool:
+        record = self._live(session_id)
+        if record is None or record["status"] != "open":
+            return False
+        record.update(copy.deepcopy(fields))
+        record["status"] = "completed"
+        return True
+
+    @timed
+    async def reopen(self, session_id: str):
+        self._update(session_id, {"status": "open"})
+
+    @timed
+    async def purge_expired(self) -> int:
+        now = datetime.now(timezone.utc)
+        expired = [key for key, record in self.records.items() if record["expires_at"] <= now]
+        for key in expired:
+            del self.records[key]
+        return len(expired)
+
+
+class MemoryNotificationRepository(MemoryRepository):
+    name = "email_outbox"
+    key = "notification_id"
+
+    @timed
+    async def insert(self, doc: dict):
+        self._insert(doc)
+
+    @timed
+    async def due(self, now: datetime, limit: int) -> List[dict]:
+        docs = [
+            doc for doc in self.records.values()
+            if doc["status"] == "pending" and doc["next_attempt_at"] <= now
+        ]
+        docs.sort(key=lambda doc: doc["next_attempt_at"])
+        return [copy.deepcopy(doc) for doc in docs[:limit]]
+
+    @timed
+    async def update(self, notification_id: str, fields: dict) -> bool:
+        return self._update(notification_id, fields)
+
+    @timed
+    async def purge(self, before: datetime) -> int:
+        stale = [
+            key for key, doc in self.records.items()
+            if doc["status"] in ("sent", "failed") and doc["updated_at"] < before
+        ]
+        for key in stale:
+            del self.records[key]
+        return len(stale)
+
+
+class MemoryLeaseRepository(MemoryRepository):
+    name = "leases"
+    key = "name"
+
+    @timed
+    async def acquire(self, name: str, holder: str, ttl_seconds: float) -> bool:
+        now = datetime.now(timezone.utc)
+        lease = self.records.get(name)
+        if lease is not None and lease["holder"] != holder and lease["expires_at"] > now:
+            return False
+        self.records[name] = {"name": name, "holder": holder, "expires_at": now + timedelta(seconds=ttl_seconds)}
+        return True
+
+    @timed
+    async def release(self, name: str, holder: str):
+        lease = self.records.get(name)
+        if lease is not None and lease["holder"] == holder:
+            del self.records[name]
+
+
+class MemoryRepositories:
+    backend = "memory"
+
+    def __init__(self, instrumentation: Optional[QueryInstrumentation] = None):
+        self.instrumentation = instrumentation or QueryInstrumentation()
+        self.events = MemoryEventRepository(self.instrumentation)
+        self.services = MemoryServiceRepository(self.instrumentation)
+        self.enquiries = MemoryEnquiryRepository(self.instrumentation)
+        self.customers = MemoryCustomerRepository(self.instrumentation)
+        self.content = MemoryContentRepository(self.instrumentation)
+        self.admins = MemoryAdminRepository(self.instrumentation)
+        self.uploads = MemoryUploadSessionRepository(self.instrumentation)
+        self.notifications = MemoryNotificationRepository(self.instrumentation)
+        self.leases = MemoryLeaseRepository(self.instrumentation)
+
+    def all(self) -> list:
+        return [
+            self.events, self.services, self.enquiries, self.customers, self.content,
+            self.admins, self.uploads, self.notifications, self.leases,
+        ]
+
+    async def ensure_indexes(self) -> List[str]:
+        return []
+
+    async def ping(self):
+        pass
+
+    async def warm_pool(self, connections: int):
+        pass
+
+    def pool_state(self) -> dict:
+        return {"backend": self.backend}
+
+    def close(self):
+        pass
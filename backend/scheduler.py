@@ -0,0 +1,263 @@
+"""
+In-process asyncio job scheduler
+
+Jobs run on a fixed interval or a five-field cron expression, with optional
+random jitter so workers started together do not fire in lockstep. Jobs marked
+leader_only run on a single worker: instances compete for a lease document and
+only the current holder runs them. Every job keeps run-time metrics.
+"""
+import asyncio
+import logging
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class IntervalTrigger:
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise ValueError("Interval must be positive")
+        self.seconds = seconds
+
+    def next_run(self, after: datetime) -> datetime:
+        return after + timedelta(seconds=self.seconds)
+
+    def __str__(self) -> str:
+        return f"every {self.seconds:g}s"
+
+
+class CronTrigger:
+    """Five-field cron (minute hour day-of-month month day-of-week), evaluated in UTC
+
+    Fields accept `*`, numbers, ranges `a-b`, steps `*/n` or `a-b/n`, and comma
+    separated lists. Day-of-week uses 0-6 with 0 = Sunday (7 is also Sunday).
+    """
+
+    FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+        self.expression = expression
+        parsed = [self._parse(field, low, high) for field, (low, high) in zip(fields, self.FIELD_RANGES)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        self.weekdays = {0 if day == 7 else day for day in weekdays}
+        self.any_day = fields[2] == "*"
+        self.any_weekday = fields[4] == "*"
+
+    @staticmethod
+    def _parse(field: str, low: int, high: int) -> Set[int]:
+        values = set()
+        for part in field.split(","):
+            step = 1
+            if "/" in part:
+                part, step_text = part.split("/", 1)
+                step = int(step_text)
+                if step <= 0:
+                    raise ValueError(f"Invalid cron step: {field!r}")
+            if part == "*":
+                start, end = low, high
+            elif "-" in part:
+                start_text, end_text = part.split("-", 1)
+                start, end = int(start_text), int(end_text)
+            else:
+                start = end = int(part)
+            if start < low or end > high or start > end:
+                raise ValueError(f"Cron field out of range: {field!r}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.isoweekday() % 7) in self.weekdays
+        # Standard cron: when both day fields are restricted, either may match
+        if not self.any_day and not self.any_weekday:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_run(self, after: datetime) -> datetime:
+        moment = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=366 * 4)
+        while moment < limit:
+            if moment.month not in self.months:
+                moment = (moment.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+                continue
+            if not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+                continue
+            if moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+                continue
+            return moment
+        raise ValueError(f"Cron expression never fires: {self.expression!r}")
+
+    def __str__(self) -> str:
+        return f"cron {self.expression}"
+
+
+class Job:
+    def __init__(self, name: str, func: Callable[[], Awaitable[None]], trigger, jitter_seconds: float, leader_only: bool, run_at_start: bool):
+        self.name = name
+        self.func = func
+        self.trigger = trigger
+        self.jitter_seconds = jitter_seconds
+        self.leader_only = leader_only
+        self.run_at_start = run_at_start
+        self.next_run: Optional[datetime] = None
+        self.running = False
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_started: Optional[datetime] = None
+        self.last_duration_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def schedule_next(self, now: datetime):
+        self.next_run = self.trigger.next_run(now) + timedelta(seconds=random.uniform(0, self.jitter_seconds))
+
+    def metrics(self) -> dict:
+        return {
+            "name": self.name,
+            "trigger": str(self.trigger),
+            "leader_only": self.leader_only,
+            "running": self.running,
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "avg_ms": round(self.total_ms / self.runs, 1) if self.runs else None,
+            "max_ms": round(self.max_ms, 1),
+            "last_started": self.last_started.isoformat() if self.last_started else None,
+            "last_duration_ms": round(self.last_duration_ms, 1) if self.last_duration_ms is not None else None,
+            "last_error": self.last_error,
+            "next_run": self.next_run.isoformat() if self.next_run else None,
+        }
+
+
+class Scheduler:
+    """Runs registered jobs in the background of the current event loop"""
+
+    def __init__(self, leases=None, lease_name: str = "scheduler-leader", lease_ttl_seconds: float = 30, tick_seconds: float = 1):
+        self.leases = leases
+        self.lease_name = lease_name
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self.tick_seconds = tick_seconds
+        self.instance_id = str(uuid.uuid4())
+        self.jobs: Dict[str, Job] = {}
+        self.is_leader = leases is None
+        self._tasks: List[asyncio.Task] = []
+        self._running: Set[asyncio.Task] = set()
+
+    def add_job(self, name: str, func, trigger, jitter_seconds: float = 0, leader_only: bool = False, run_at_start: bool = False) -> Job:
+        if name in self.jobs:
+            raise ValueError(f"Job already registered: {name}")
+        job = Job(name, func, trigger, jitter_seconds, leader_only, run_at_start)
+        self.jobs[name] = job
+        return job
+
+    def interval(self, name: str, seconds: float, **options):
+        """Decorator registering a coroutine function to run every `seconds`"""
+        def decorator(func):
+            self.add_job(name, func, IntervalTrigger(seconds), **options)
+            return func
+        return decorator
+
+    def cron(self, name: str, expression: str, **options):
+        """Decorator registering a coroutine function on a cron schedule"""
+        def decorator(func):
+            self.add_job(name, func, CronTrigger(expression), **options)
+            return func
+        return decorator
+
+    async def start(self):
+        if self._tasks:
+            return
+        now = datetime.now(timezone.utc)
+        for job in self.jobs.values():
+            if job.run_at_start:
+                job.next_run = now + timedelta(seconds=random.uniform(0, job.jitter_seconds))
+            else:
+                job.schedule_next(now)
+        if self.leases is not None:
+            self._tasks.append(asyncio.create_task(self._lease_loop()))
+        self._tasks.append(asyncio.create_task(self._tick_loop()))
+        logger.info(f"Scheduler started with {len(self.jobs)} jobs (instance {self.instance_id})")
+
+    async def stop(self):
+        for task in self._tasks + list(self._running):
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._running, return_exceptions=True)
+        self._tasks = []
+        self._running.clear()
+        if self.leases is not None and self.is_leader:
+            try:
+                await self.leases.release(self.lease_name, self.instance_id)
+            except Exception as e:
+                logger.error(f"Failed to release scheduler lease: {str(e)}")
+        self.is_leader = self.leases is None
+
+    async def run_job(self, name: str):
+        """Run a job now, outside its schedule"""
+        await self._run(self.jobs[name])
+
+    async def _lease_loop(self):
+        while True:
+            try:
+                self.is_leader = await self.leases.acquire(self.lease_name, self.instance_id, self.lease_ttl_seconds)
+            except Exception as e:
+                logger.error(f"Scheduler lease renewal failed: {str(e)}")
+                self.is_leader = False
+            # Renew well before expiry so a healthy leader never loses the lease
+            await asyncio.sleep(self.lease_ttl_seconds / 3)
+
+    async def _tick_loop(self):
+        while True:
+            now = datetime.now(timezone.utc)
+            for job in self.jobs.values():
+                if job.next_run is None or job.next_run > now:
+                    continue
+                job.schedule_next(now)
+                if job.running or (job.leader_only and not self.is_leader):
+                    job.skipped += 1
+                    continue
+                task = asyncio.create_task(self._run(job))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+            await asyncio.sleep(self.tick_seconds)
+
+    async def _run(self, job: Job):
+        job.running = True
+        job.last_started = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        try:
+            await job.func()
+            job.last_error = None
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            job.failures += 1
+            job.last_error = str(e)
+            logger.error(f"Job {job.name} failed: {str(e)}")
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            job.running = False
+            job.runs += 1
+            job.total_ms += duration_ms
+            job.max_ms = max(job.max_ms, duration_ms)
+            job.last_duration_ms = duration_ms
+
+    def metrics(self) -> dict:
+        return {
+            "instance_id": self.instance_id,
+            "is_leader": self.is_leader,
+            "jobs": [job.metrics() for job in self.jobs.values()],
+        }
@@ -1,62 +1,220 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, Query
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, Query, Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
 import os
+import re
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, EmailStr, ConfigDict
-from typing import List, Optional
+from typing import List, Optional, Union
 import uuid
-from datetime import datetime, timezone, timedelta
-from passlib.context import CryptContext
-from jose import JWTError, jwt
+import copy
+from urllib.parse import urlsplit
+from datetime import datetime, timezone, timedelta, date
 import time
-import cloudinary
-import cloudinary.utils
 import asyncio
-import resend
+from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 
+from providers import (
+    CloudinarySigner,
+    EmailSender,
+    InvalidTokenError,
+    MongoProvider,
+    PasswordHasher,
+    TokenCodec,
+)
+from repositories import ADMIN_EVENT_SUMMARY_FIELDS, DateRange, MemoryRepositories, MongoRepositories, QueryInstrumentation
+from scheduler import Scheduler
+from snapshots import SnapshotFiles, SnapshotPublisher
+
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
-mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
-
-# Cloudinary configuration
-cloudinary.config(
-    cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
-    api_key=os.getenv("CLOUDINARY_API_KEY"),
-    api_secret=os.getenv("CLOUDINARY_API_SECRET"),
-    secure=True
-)
+# MongoDB connection (the client is created on first use)
+MONGO_POOL_OPTIONS = {
+    "maxPoolSize": int(os.getenv("MONGO_MAX_POOL_SIZE", 20)),
+    "minPoolSize": int(os.getenv("MONGO_MIN_POOL_SIZE", 2)),
+    "maxIdleTimeMS": int(os.getenv("MONGO_MAX_IDLE_TIME_MS", 300000)),
+    "connectTimeoutMS": int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", 5000)),
+    "serverSelectionTimeoutMS": int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", 5000)),
+    "socketTimeoutMS": int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", 20000)),
+    "compressors": os.getenv("MONGO_COMPRESSORS", "zlib"),
+}
+
+# Data access goes through repositories; DATA_BACKEND=memory swaps Mongo for an
+# in-process store for local benchmarks and tests
+DATA_BACKEND = os.getenv("DATA_BACKEND", "mongo")
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", 200))
+
+query_instrumentation = QueryInstrumentation()
+
+def log_slow_query(collection: str, operation: str, duration_ms: float):
+    if duration_ms >= SLOW_QUERY_MS:
+        logger.warning(f"Slow query: {collection}.{operation} took {duration_ms:.1f} ms")
 
-# Resend configuration
-resend.api_key = os.getenv("RESEND_API_KEY")
+query_instrumentation.add_hook(log_slow_query)
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+if DATA_BACKEND == "memory":
+    repos = MemoryRepositories(query_instrumentation)
+else:
+    mongo = MongoProvider(os.environ['MONGO_URL'], os.environ['DB_NAME'], MONGO_POOL_OPTIONS)
+    repos = MongoRepositories(mongo, query_instrumentation)
+
+# Cloudinary, Resend and password hashing load on first use
+cloudinary_signer = CloudinarySigner()
+email_sender = EmailSender()
+password_hasher = PasswordHasher()
 
 # JWT configuration
 JWT_SECRET = os.getenv("JWT_SECRET")
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 JWT_EXPIRATION_HOURS = int(os.getenv("JWT_EXPIRATION_HOURS", 24))
+token_codec = TokenCodec(JWT_SECRET, JWT_ALGORITHM)
 
 # Security
 security = HTTPBearer()
 
+# Application lifespan: indexes, connection warm-up and cache priming
+PUBLIC_CONTENT_SECTIONS = ["homepage", "about", "location"]
+
+app_state = {"ready": False, "warmed_at": None, "warmup_ms": None, "index_failures": []}
+
+DEFAULT_SHOWCASE_LIMIT = 60
+
+async def prime_public_caches() -> dict:
+    """Reload the default public payloads and swap them into the caches
+
+    Fresh values overwrite the old entries instead of invalidating them first,
+    so visitors keep hitting the cache while a refresh is running.
+    """
+    default_filters = {"category": None, "event_type": None, "location": None, "year": None}
+    events, showcase, services, *sections = await asyncio.gather(
+        repos.events.list_summaries(),
+        repos.events.showcase(default_filters, 0, DEFAULT_SHOWCASE_LIMIT),
+        repos.services.list(),
+        *(read_content_section(name) for name in PUBLIC_CONTENT_SECTIONS)
+    )
+
+    event_summary_cache.set((None, None, None), events)
+    showcase_cache.set((None, None, None, None, 0, DEFAULT_SHOWCASE_LIMIT), showcase)
+    service_cache.set("*", services)
+    for section in sections:
+        content_cache.set(section["section_name"], section)
+    return {"events": events, "services": services, "sections": sections}
+
+async def warm_up():
+    """Open pooled connections and prime the public caches before taking traffic"""
+    started = time.perf_counter()
+    await repos.ping()
+
+    # Index builds can fail on existing data (e.g. duplicates under a new unique
+    # index); that needs fixing, but must not keep the API out of rotation
+    app_state["index_failures"] = await repos.ensure_indexes()
+    for failure in app_state["index_failures"]:
+        logger.error(f"Index build failed: {failure}")
+
+    # Open the pool up to its minimum size so the first user requests do not
+    # pay for TCP/TLS setup
+    await repos.warm_pool(MONGO_POOL_OPTIONS["minPoolSize"])
+
+    await prime_public_caches()
+
+    app_state["ready"] = True
+    app_state["warmed_at"] = datetime.now(timezone.utc).isoformat()
+    app_state["warmup_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    logger.info(f"Warm-up complete in {app_state['warmup_ms']} ms")
+
+HEALTH_PING_TIMEOUT_SECONDS = float(os.getenv("HEALTH_PING_TIMEOUT_SECONDS", 2))
+warm_up_retry: Optional[asyncio.Task] = None
+
+async def retry_warm_up():
+    try:
+        await warm_up()
+        snapshot_publisher.schedule()
+    except Exception as e:
+        logger.error(f"Warm-up retry failed: {str(e)}")
+
+def request_warm_up_retry():
+    """Retry the warm-up in the background, with at most one attempt in flight"""
+    global warm_up_retry
+    if app_state["ready"] or (warm_up_retry is not None and not warm_up_retry.done()):
+        return
+    warm_up_retry = asyncio.create_task(retry_warm_up())
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await warm_up()
+        snapshot_publisher.schedule()
+    except Exception as e:
+        # Keep serving; /health/ready retries the warm-up until Mongo is reachable
+        logger.error(f"Warm-up failed: {str(e)}")
+    if SCHEDULER_ENABLED:
+        await scheduler.start()
+    yield
+    if warm_up_retry is not None:
+        warm_up_retry.cancel()
+    await scheduler.stop()
+    repos.close()
+
 # Create the main app
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 api_router = APIRouter(prefix="/api")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# In-process response caches
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", 60))
+
+class TTLCache:
+    """Small dict-backed cache whose entries expire after a fixed TTL"""
+
+    def __init__(self, ttl_seconds: float = CACHE_TTL_SECONDS, max_entries: int = 512):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = {}
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key, value):
+        if len(self._entries) >= self.max_entries and key not in self._entries:
+            # Drop the entry closest to expiry to make room
+            oldest = min(self._entries, key=lambda k: self._entries[k][0])
+            self._entries.pop(oldest, None)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self, key=None):
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+event_summary_cache = TTLCache()
+event_detail_cache = TTLCache()
+showcase_cache = TTLCache()
+content_cache = TTLCache()
+service_cache = TTLCache()
+
+def invalidate_event_caches(event_id: Optional[str] = None):
+    event_summary_cache.invalidate()
+    showcase_cache.invalidate()
+    if event_id is None:
+        event_detail_cache.invalidate()
+    else:
+        event_detail_cache.invalidate(event_id)
+
 # Pydantic Models
 class AdminCreate(BaseModel):
     email: EmailStr
@@ -88,6 +246,35 @@ class Event(BaseModel):
     date: str
     created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
+class EventSummary(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    event_id: str
+    title: str
+    category: str
+    location: str
+    date: str
+    cover_image: Optional[str] = None
+    image_count: int = 0
+
+class AdminEventSummary(EventSummary):
+    event_type: str
+    description: str
+
+class FacetCount(BaseModel):
+    value: Union[str, int]
+    count: int
+
+class ShowcaseFacets(BaseModel):
+    category: List[FacetCount] = []
+    event_type: List[FacetCount] = []
+    location: List[FacetCount] = []
+    year: List[FacetCount] = []
+
+class ShowcaseResponse(BaseModel):
+    events: List[EventSummary]
+    total: int
+    facets: ShowcaseFacets
+
 class EventCreate(BaseModel):
     title: str
     location: str
@@ -131,6 +318,7 @@ class Enquiry(BaseModel):
     location: str
     message: str
     status: str = "new"
+    customer_id: Optional[str] = None
     created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
 class EnquiryCreate(BaseModel):
@@ -145,6 +333,24 @@ class EnquiryCreate(BaseModel):
 class EnquiryStatusUpdate(BaseModel):
     status: str
 
+class CustomerSummary(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    customer_id: str
+    name: str
+    phone: str
+    email: str
+    submission_count: int
+    latest_enquiry_id: str
+    latest_status: str
+    latest_event_type: str
+    latest_event_date: str
+    first_enquiry_at: str
+    last_enquiry_at: str
+
+class CustomerEnquiries(BaseModel):
+    customer: CustomerSummary
+    enquiries: List[Enquiry]
+
 class Content(BaseModel):
     model_config = ConfigDict(extra="ignore")
     section_name: str
@@ -152,6 +358,16 @@ class Content(BaseModel):
 
 class ContentUpdate(BaseModel):
     content: dict
+    # Version the edit was based on; the save is rejected if the section moved on
+    version: Optional[int] = None
+
+class ContentVersion(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    section_name: str
+    version: int
+    patch: List[dict]
+    updated_by: Optional[str] = None
+    created_at: str
 
 class CloudinarySignatureResponse(BaseModel):
     signature: str
@@ -161,34 +377,219 @@ class CloudinarySignatureResponse(BaseModel):
     folder: str
     resource_type: str
 
+UPLOAD_SESSION_MAX_FILES = 100
+
+class UploadSessionCreate(BaseModel):
+    count: int = Field(ge=1, le=UPLOAD_SESSION_MAX_FILES)
+    resource_type: str = Field("image", pattern="^(image|video)$")
+    folder: str = "ambica-wedding"
+    event_id: Optional[str] = None
+
+class UploadSignature(BaseModel):
+    public_id: str
+    signature: str
+
+class UploadSessionResponse(BaseModel):
+    session_id: str
+    timestamp: int
+    expires_at: str
+    cloud_name: str
+    api_key: str
+    folder: str
+    resource_type: str
+    uploads: List[UploadSignature]
+
+class UploadSessionComplete(BaseModel):
+    urls: List[str]
+    event_id: Optional[str] = None
+
 # Helper Functions
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.verify(plain_password, hashed_password)
 
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(hours=JWT_EXPIRATION_HOURS)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    encoded_jwt = token_codec.encode(to_encode)
     return encoded_jwt
 
+# Typed date storage: every free-form date string is mirrored by a BSON datetime
+TYPED_DATE_FIELDS = {
+    "date": "date_dt",
+    "event_date": "event_date_dt",
+    "created_at": "created_at_dt",
+}
+
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO date/datetime string into an aware UTC datetime, or None"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+def add_typed_dates(doc: dict) -> dict:
+    """Store a BSON datetime next to each string date field present in doc"""
+    for field, typed_field in TYPED_DATE_FIELDS.items():
+        if field in doc:
+            doc[typed_field] = parse_date(doc[field])
+    return doc
+
+def date_bounds(start: Optional[date], end: Optional[date]) -> Optional[DateRange]:
+    """Turn an inclusive day range into datetime bounds for a typed date field"""
+    if start is None and end is None:
+        return None
+    lower = datetime(start.year, start.month, start.day, tzinfo=timezone.utc) if start else None
+    upper = datetime(end.year, end.month, end.day, tzinfo=timezone.utc) + timedelta(days=1) if end else None
+    return (lower, upper)
+
+# Customer index: enquiries from the same person share a normalised phone or email
+def normalize_phone(phone: Optional[str]) -> Optional[str]:
+    """Digits only, keeping the last ten so +91 and 0 prefixes match the bare number"""
+    digits = re.sub(r"\D", "", phone or "")
+    return digits[-10:] or None
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    return (email or "").strip().lower() or None
+
+async def index_enquiry_customer(doc: dict) -> str:
+    """Record an enquiry in the customer index, returning its customer_id"""
+    return await repos.customers.record_enquiry(doc, normalize_phone(doc.get("phone")), normalize_email(doc.get("email")))
+
+# Content versioning: each save is stored as an RFC 6902 JSON-patch diff
+def _escape_pointer(key) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+def _unescape_pointer(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+def json_diff(old, new, path: str = "") -> List[dict]:
+    """Compute JSON-patch ops turning old into new (lists are replaced whole)"""
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape_pointer(key)}"})
+        for key, value in new.items():
+            child_path = f"{path}/{_escape_pointer(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child_path, "value": value})
+            else:
+                ops.extend(json_diff(old[key], value, child_path))
+        return ops
+    if old == new:
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+def apply_patch(doc, ops: List[dict]):
+    """Apply JSON-patch ops produced by json_diff, returning a new document"""
+    doc = copy.deepcopy(doc)
+    for op in ops:
+        tokens = [_unescape_pointer(t) for t in op["path"].split("/")[1:]]
+        if not tokens:
+            doc = copy.deepcopy(op["value"])
+            continue
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[token]
+        if op["op"] == "remove":
+            parent.pop(tokens[-1], None)
+        else:
+            parent[tokens[-1]] = copy.deepcopy(op["value"])
+    return doc
+
+def content_etag(sections: List[dict]) -> str:
+    """Weak validator built from the section names and versions"""
+    tag = ",".join(f"{section['section_name']}.{section.get('version', 0)}" for section in sections)
+    return f'W/"{tag}"'
+
+async def read_content_section(section_name: str) -> dict:
+    """Read a section straight from the store, bypassing the per-process cache"""
+    content = await repos.content.get(section_name)
+    if not content:
+        content = {"section_name": section_name, "content": {}, "version": 0}
+    content.setdefault("version", 0)
+    return content
+
+async def load_content_section(section_name: str) -> dict:
+    cached = content_cache.get(section_name)
+    if cached is not None:
+        return cached
+
+    content = await read_content_section(section_name)
+    content_cache.set(section_name, content)
+    return content
+
+def parse_section_names(sections: str) -> List[str]:
+    names = list(dict.fromkeys(name.strip() for name in sections.split(",") if name.strip()))
+    if not names:
+        raise HTTPException(status_code=400, detail="No sections requested")
+    return names
+
+def etag_version(if_match: Optional[str], section_name: str) -> Optional[int]:
+    """Read a section's version back out of an If-Match header carrying its ETag"""
+    if not if_match:
+        return None
+    tag = if_match.strip().removeprefix("W/").strip('"')
+    name, _, version = tag.rpartition(".")
+    if name != section_name or not version.isdigit():
+        raise HTTPException(status_code=400, detail="If-Match does not match this section")
+    return int(version)
+
+async def save_content_version(section_name: str, new_content: dict, admin_email: Optional[str], expected_version: Optional[int] = None) -> dict:
+    """Store new_content as the next version of a section, recording only the diff"""
+    current = await repos.content.get(section_name)
+    old_content = current["content"] if current else {}
+    current_version = current.get("version", 0) if current else 0
+
+    if expected_version is not None and expected_version != current_version:
+        raise HTTPException(status_code=409, detail="Content was modified concurrently, reload and retry")
+
+    patch = json_diff(old_content, new_content)
+    if current and not patch:
+        current.setdefault("version", current_version)
+        return current
+
+    version = current_version + 1
+    try:
+        saved = await repos.content.save_version(current, new_content, {
+            "section_name": section_name,
+            "version": version,
+            "patch": patch,
+            "revert": json_diff(new_content, old_content),
+            "updated_by": admin_email,
+            "created_at": datetime.now(timezone.utc).isoformat()
+        })
+    finally:
+        content_cache.invalidate(section_name)
+
+    if not saved:
+        raise HTTPException(status_code=409, detail="Content was modified concurrently, reload and retry")
+
+    return {"section_name": section_name, "content": new_content, "version": version}
+
 async def get_current_admin(credentials: HTTPAuthorizationCredentials = Depends(security)):
     try:
         token = credentials.credentials
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = token_codec.decode(token)
         email: str = payload.get("sub")
         if email is None:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authentication credentials")
         
-        admin = await db.admins.find_one({"email": email}, {"_id": 0})
+        admin = await repos.admins.get_by_email(email)
         if admin is None:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Admin not found")
         
         return admin
-    except JWTError:
+    except InvalidTokenError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
 async def send_email_notification(recipient_email: str, subject: str, html_content: str):
@@ -202,11 +603,32 @@ async def send_email_notification(recipient_email: str, subject: str, html_conte
     }
     
     try:
-        email = await asyncio.to_thread(resend.Emails.send, params)
+        email = await asyncio.to_thread(email_sender.send, params)
         logger.info(f"Email sent to {recipient_email}: {email.get('id')}")
         return email
     except Exception as e:
         logger.error(f"Failed to send email: {str(e)}")
+        await queue_email_retry(params, str(e))
+
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", 5))
+EMAIL_RETRY_BASE_SECONDS = int(os.getenv("EMAIL_RETRY_BASE_SECONDS", 60))
+
+async def queue_email_retry(params: dict, error: str):
+    """Park a failed email in the outbox for the retry job"""
+    now = datetime.now(timezone.utc)
+    try:
+        await repos.notifications.insert({
+            "notification_id": str(uuid.uuid4()),
+            "params": params,
+            "attempts": 1,
+            "status": "pending",
+            "last_error": error,
+            "next_attempt_at": now + timedelta(seconds=EMAIL_RETRY_BASE_SECONDS),
+            "created_at": now.isoformat(),
+            "updated_at": now
+        })
+    except Exception as e:
+        logger.error(f"Failed to queue email retry: {str(e)}")
 
 # Authentication Routes
 @api_router.post("/auth/register", response_model=AdminResponse)
@@ -214,7 +636,7 @@ async def register_admin(admin_data: AdminCreate):
     """Register first admin only (disabled after one admin exists)"""
 
     # Check if any admin already exists
-    existing_count = await db.admins.count_documents({})
+    existing_count = await repos.admins.count()
 
     if existing_count > 0:
         raise HTTPException(
@@ -231,7 +653,7 @@ async def register_admin(admin_data: AdminCreate):
         "created_at": datetime.now(timezone.utc).isoformat()
     }
 
-    await db.admins.insert_one(admin_doc)
+    await repos.admins.insert(admin_doc)
 
     return AdminResponse(
         email=admin_data.email,
@@ -242,7 +664,7 @@ async def register_admin(admin_data: AdminCreate):
 @api_router.post("/auth/login", response_model=TokenResponse)
 async def login_admin(login_data: AdminLogin):
     """Admin login"""
-    admin = await db.admins.find_one({"email": login_data.email}, {"_id": 0})
+    admin = await repos.admins.get_by_email(login_data.email)
     if not admin or not verify_password(login_data.password, admin["password"]):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
@@ -258,73 +680,141 @@ async def get_current_admin_info(admin: dict = Depends(get_current_admin)):
     return AdminResponse(email=admin["email"], name=admin["name"])
 
 # Event Routes
-@api_router.get("/events", response_model=List[Event])
-async def get_events(category: Optional[str] = None):
-    """Get all events with optional category filter"""
-    query = {}
-    if category:
-        query["category"] = category
-    
-    events = await db.events.find(query, {"_id": 0}).to_list(1000)
+@api_router.get("/events", response_model=List[EventSummary])
+async def get_events(
+    category: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None
+):
+    """Get event summaries with optional category and date range filters"""
+    cache_key = (category, date_from, date_to)
+    cached = event_summary_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    events = await repos.events.list_summaries(category, date_bounds(date_from, date_to))
+    event_summary_cache.set(cache_key, events)
     return events
 
+@api_router.get("/showcase", response_model=ShowcaseResponse)
+async def get_showcase(
+    category: Optional[str] = None,
+    event_type: Optional[str] = None,
+    location: Optional[str] = None,
+    year: Optional[int] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_SHOWCASE_LIMIT, ge=1, le=1000)
+):
+    """Faceted showcase browsing: matching events plus counts for every facet value"""
+    filters = {"category": category, "event_type": event_type, "location": location, "year": year}
+    cache_key = (category, event_type, location, year, skip, limit)
+    cached = showcase_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    showcase = await repos.events.showcase(filters, skip, limit)
+    showcase_cache.set(cache_key, showcase)
+    return showcase
+
+@api_router.get("/events/{event_id}", response_model=Event)
+async def get_event(event_id: str):
+    """Get full event detail"""
+    cached = event_detail_cache.get(event_id)
+    if cached is not None:
+        return cached
+
+    event = await repos.events.get(event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    event_detail_cache.set(event_id, event)
+    return event
+
+@api_router.get("/admin/events", response_model=List[AdminEventSummary])
+async def get_events_for_admin(admin: dict = Depends(get_current_admin)):
+    """Get event summaries uncached, with type and description, so the admin list reflects every write (admin only)"""
+    return await repos.events.list_summaries(extra_fields=ADMIN_EVENT_SUMMARY_FIELDS)
+
+@api_router.get("/admin/events/{event_id}", response_model=Event)
+async def get_event_for_edit(event_id: str, admin: dict = Depends(get_current_admin)):
+    """Get full event detail uncached, so edit forms never save over newer writes (admin only)"""
+    event = await repos.events.get(event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+    return event
+
 @api_router.post("/events", response_model=Event)
 async def create_event(event_data: EventCreate, admin: dict = Depends(get_current_admin)):
     """Create new event (admin only)"""
     event_obj = Event(**event_data.model_dump())
-    doc = event_obj.model_dump()
+    doc = add_typed_dates(event_obj.model_dump())
     
-    await db.events.insert_one(doc)
+    await repos.events.insert(doc)
+    invalidate_event_caches(event_obj.event_id)
+    snapshot_publisher.schedule()
     return event_obj
 
 @api_router.put("/events/{event_id}", response_model=Event)
 async def update_event(event_id: str, event_data: EventUpdate, admin: dict = Depends(get_current_admin)):
     """Update event (admin only)"""
-    event = await db.events.find_one({"event_id": event_id}, {"_id": 0})
+    event = await repos.events.get(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     
     update_data = {k: v for k, v in event_data.model_dump().items() if v is not None}
     if update_data:
-        await db.events.update_one({"event_id": event_id}, {"$set": update_data})
+        add_typed_dates(update_data)
+        await repos.events.update(event_id, update_data)
         event.update(update_data)
+        invalidate_event_caches(event_id)
+        snapshot_publisher.schedule()
     
     return Event(**event)
 
 @api_router.delete("/events/{event_id}")
 async def delete_event(event_id: str, admin: dict = Depends(get_current_admin)):
     """Delete event (admin only)"""
-    result = await db.events.delete_one({"event_id": event_id})
-    if result.deleted_count == 0:
+    if not await repos.events.delete(event_id):
         raise HTTPException(status_code=404, detail="Event not found")
     
+    invalidate_event_caches(event_id)
+    snapshot_publisher.schedule()
     return {"message": "Event deleted successfully"}
 
 # Service Routes
 @api_router.get("/services", response_model=List[Service])
 async def get_services():
     """Get all services"""
-    services = await db.services.find({}, {"_id": 0}).to_list(100)
+    cached = service_cache.get("*")
+    if cached is not None:
+        return cached
+
+    services = await repos.services.list()
+    service_cache.set("*", services)
     return services
 
 @api_router.put("/services/{service_id}", response_model=Service)
 async def update_service(service_id: str, service_data: ServiceUpdate, admin: dict = Depends(get_current_admin)):
     """Update service (admin only)"""
-    service = await db.services.find_one({"service_id": service_id}, {"_id": 0})
+    service = await repos.services.get(service_id)
     if not service:
         raise HTTPException(status_code=404, detail="Service not found")
     
     update_data = {k: v for k, v in service_data.model_dump().items() if v is not None}
     if update_data:
-        await db.services.update_one({"service_id": service_id}, {"$set": update_data})
+        await repos.services.update(service_id, update_data)
         service.update(update_data)
+        service_cache.invalidate()
+        snapshot_publisher.schedule()
     
     return Service(**service)
 
 @api_router.post("/services", response_model=Service)
 async def create_service(service_data: Service, admin: dict = Depends(get_current_admin)):
     service_obj = Service(**service_data.model_dump())
-    await db.services.insert_one(service_obj.model_dump())
+    await repos.services.insert(service_obj.model_dump())
+    service_cache.invalidate()
+    snapshot_publisher.schedule()
     return service_obj
 
 
@@ -333,9 +823,16 @@ async def create_service(service_data: Service, admin: dict = Depends(get_curren
 async def create_enquiry(enquiry_data: EnquiryCreate):
     """Submit enquiry (public)"""
     enquiry_obj = Enquiry(**enquiry_data.model_dump())
-    doc = enquiry_obj.model_dump()
+    doc = add_typed_dates(enquiry_obj.model_dump())
     
-    await db.enquiries.insert_one(doc)
+    await repos.enquiries.insert(doc)
+    # Index only once the enquiry is stored so a failed insert is never counted;
+    # an enquiry left unlinked by a failure here is picked up by backfill_customers.py
+    try:
+        enquiry_obj.customer_id = await index_enquiry_customer(doc)
+        await repos.enquiries.set_customer(enquiry_obj.enquiry_id, enquiry_obj.customer_id)
+    except Exception as e:
+        logger.error(f"Failed to index enquiry customer: {str(e)}")
     
     # Send email notification to admin
     admin_email = os.getenv("ADMIN_EMAIL")
@@ -365,42 +862,121 @@ async def create_enquiry(enquiry_data: EnquiryCreate):
     return enquiry_obj
 
 @api_router.get("/enquiries", response_model=List[Enquiry])
-async def get_enquiries(admin: dict = Depends(get_current_admin)):
-    """Get all enquiries (admin only)"""
-    enquiries = await db.enquiries.find({}, {"_id": 0}).sort("created_at", -1).to_list(1000)
+async def get_enquiries(
+    event_date_from: Optional[date] = None,
+    event_date_to: Optional[date] = None,
+    created_from: Optional[date] = None,
+    created_to: Optional[date] = None,
+    admin: dict = Depends(get_current_admin)
+):
+    """Get enquiries with optional event date and submission date ranges (admin only)"""
+    enquiries = await repos.enquiries.list(
+        date_bounds(event_date_from, event_date_to),
+        date_bounds(created_from, created_to)
+    )
     return enquiries
 
+@api_router.get("/enquiries/customers", response_model=List[CustomerSummary])
+async def get_enquiry_customers(
+    status: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    admin: dict = Depends(get_current_admin)
+):
+    """Enquiries grouped by customer, most recently active first, with the latest status and submission count (admin only)"""
+    return await repos.customers.list(status, skip, limit)
+
+@api_router.get("/enquiries/customers/{customer_id}", response_model=CustomerEnquiries)
+async def get_customer_enquiries(customer_id: str, admin: dict = Depends(get_current_admin)):
+    """One customer with all of their enquiries, newest first (admin only)"""
+    customer, enquiries = await asyncio.gather(
+        repos.customers.get(customer_id),
+        repos.enquiries.list_for_customer(customer_id)
+    )
+    if not customer:
+        raise HTTPException(status_code=404, detail="Customer not found")
+    return {"customer": customer, "enquiries": enquiries}
+
 @api_router.patch("/enquiries/{enquiry_id}")
 async def update_enquiry_status(enquiry_id: str, status_update: EnquiryStatusUpdate, admin: dict = Depends(get_current_admin)):
     """Update enquiry status (admin only)"""
-    result = await db.enquiries.update_one(
-        {"enquiry_id": enquiry_id},
-        {"$set": {"status": status_update.status}}
-    )
-    
-    if result.matched_count == 0:
+    if not await repos.enquiries.update_status(enquiry_id, status_update.status):
         raise HTTPException(status_code=404, detail="Enquiry not found")
+    await repos.customers.update_status(enquiry_id, status_update.status)
     
     return {"message": "Enquiry status updated"}
 
 # Content Routes
+@api_router.get("/content")
+async def get_content_sections(request: Request, response: Response, sections: str = Query(..., min_length=1)):
+    """Get several content sections in one round-trip"""
+    names = parse_section_names(sections)
+    loaded = await asyncio.gather(*(load_content_section(name) for name in names))
+    etag = content_etag(loaded)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return {"sections": {section["section_name"]: section for section in loaded}}
+
+@api_router.get("/admin/content")
+async def get_content_sections_for_edit(sections: str = Query(..., min_length=1), admin: dict = Depends(get_current_admin)):
+    """Get content sections uncached, so edit forms start from the stored version (admin only)"""
+    loaded = await asyncio.gather(*(read_content_section(name) for name in parse_section_names(sections)))
+    return {"sections": {section["section_name"]: section for section in loaded}}
+
 @api_router.get("/content/{section_name}")
-async def get_content(section_name: str):
+async def get_content(section_name: str, request: Request, response: Response):
     """Get content for a section"""
-    content = await db.content.find_one({"section_name": section_name}, {"_id": 0})
-    if not content:
-        return {"section_name": section_name, "content": {}}
+    content = await load_content_section(section_name)
+    etag = content_etag([content])
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
     return content
 
 @api_router.put("/content/{section_name}")
-async def update_content(section_name: str, content_data: ContentUpdate, admin: dict = Depends(get_current_admin)):
-    """Update content (admin only)"""
-    await db.content.update_one(
-        {"section_name": section_name},
-        {"$set": {"content": content_data.content}},
-        upsert=True
-    )
-    return {"section_name": section_name, "content": content_data.content}
+async def update_content(section_name: str, content_data: ContentUpdate, request: Request, admin: dict = Depends(get_current_admin)):
+    """Update content as a new version (admin only)
+
+    Pass the edited version in the body or its ETag as If-Match to reject the
+    save when another admin changed the section in the meantime.
+    """
+    expected_version = content_data.version
+    if expected_version is None:
+        expected_version = etag_version(request.headers.get("if-match"), section_name)
+    content = await save_content_version(section_name, content_data.content, admin.get("email"), expected_version)
+    snapshot_publisher.schedule()
+    return content
+
+@api_router.get("/content/{section_name}/versions", response_model=List[ContentVersion])
+async def get_content_versions(section_name: str, admin: dict = Depends(get_current_admin)):
+    """List the saved versions of a section, newest first (admin only)"""
+    return await repos.content.list_versions(section_name)
+
+@api_router.post("/content/{section_name}/rollback/{version}")
+async def rollback_content(section_name: str, version: int, admin: dict = Depends(get_current_admin)):
+    """Restore a section to an earlier version by applying revert diffs (admin only)"""
+    current = await repos.content.get(section_name)
+    current_version = current.get("version", 0) if current else 0
+    if version < 0 or version >= current_version:
+        raise HTTPException(status_code=400, detail="Version must be older than the current version")
+
+    history = await repos.content.revert_history(section_name, version, current_version)
+    if len(history) != current_version - version:
+        raise HTTPException(status_code=404, detail="Version history incomplete")
+
+    restored = current["content"]
+    for entry in history:
+        restored = apply_patch(restored, entry["revert"])
+
+    # The revert diffs were computed from current_version, so only save on top of it
+    content = await save_content_version(section_name, restored, admin.get("email"), current_version)
+    snapshot_publisher.schedule()
+    return content
 
 # Cloudinary Routes
 @api_router.get("/cloudinary/signature", response_model=CloudinarySignatureResponse)
@@ -416,10 +992,7 @@ async def generate_cloudinary_signature(
         "folder": folder,
     }
 
-    signature = cloudinary.utils.api_sign_request(
-        params,
-        os.getenv("CLOUDINARY_API_SECRET")
-    )
+    signature = cloudinary_signer.sign(params)
 
     return CloudinarySignatureResponse(
         signature=signature,
@@ -430,6 +1003,215 @@ async def generate_cloudinary_signature(
         resource_type=resource_type   # ← THIS WAS MISSING
     )
 
+# Cloudinary rejects signed uploads whose timestamp is more than an hour old
+UPLOAD_SESSION_TTL_SECONDS = min(int(os.getenv("UPLOAD_SESSION_TTL_SECONDS", 3600)), 3600)
+
+CLOUDINARY_VERSION_SEGMENT = re.compile(r"^v\d+$")
+
+def cloudinary_asset(url: str) -> Optional[tuple]:
+    """Split a Cloudinary delivery URL of our cloud into (resource_type, "<folder>/<public_id>")
+
+    Returns None for anything that is not a plain upload URL (other hosts or
+    clouds, query strings, transformations are not expected from an upload).
+    """
+    parts = urlsplit(url)
+    if parts.scheme != "https" or parts.netloc != "res.cloudinary.com" or parts.query or parts.fragment:
+        return None
+    segments = parts.path.split("/")[1:]
+    if len(segments) < 5 or segments[0] != os.getenv("CLOUDINARY_CLOUD_NAME") or segments[2] != "upload":
+        return None
+    resource_type, asset = segments[1], segments[3:]
+    if CLOUDINARY_VERSION_SEGMENT.match(asset[0]):
+        asset = asset[1:]
+    if not asset or not all(asset):
+        return None
+    asset[-1] = asset[-1].rsplit(".", 1)[0]
+    return resource_type, "/".join(asset)
+
+@api_router.post("/cloudinary/upload-session", response_model=UploadSessionResponse)
+async def create_upload_session(session_data: UploadSessionCreate, admin: dict = Depends(get_current_admin)):
+    """Sign a batch of uploads in one round-trip, one public ID per file (admin only)"""
+    session_id = str(uuid.uuid4())
+    timestamp = int(time.time())
+    expires_at = datetime.fromtimestamp(timestamp + UPLOAD_SESSION_TTL_SECONDS, timezone.utc)
+
+    uploads = []
+    for index in range(session_data.count):
+        public_id = f"{session_id}-{index}"
+        signature = cloudinary_signer.sign({
+            "timestamp": timestamp,
+            "folder": session_data.folder,
+            "public_id": public_id,
+        })
+        uploads.append(UploadSignature(public_id=public_id, signature=signature))
+
+    await repos.uploads.insert({
+        "session_id": session_id,
+        "admin_email": admin["email"],
+        "event_id": session_data.event_id,
+        "folder": session_data.folder,
+        "resource_type": session_data.resource_type,
+        "public_ids": [upload.public_id for upload in uploads],
+        "status": "open",
+        "expires_at": expires_at,
+        "created_at": datetime.now(timezone.utc).isoformat()
+    })
+
+    return UploadSessionResponse(
+        session_id=session_id,
+        timestamp=timestamp,
+        expires_at=expires_at.isoformat(),
+        cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
+        api_key=os.getenv("CLOUDINARY_API_KEY"),
+        folder=session_data.folder,
+        resource_type=session_data.resource_type,
+        uploads=uploads
+    )
+
+@api_router.post("/cloudinary/upload-session/{session_id}/complete")
+async def complete_upload_session(
+    session_id: str,
+    completion: UploadSessionComplete,
+    admin: dict = Depends(get_current_admin)
+):
+    """Attach every uploaded URL of a session to its event in one write (admin only)"""
+    session = await repos.uploads.get(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Upload session not found or expired")
+    if session["status"] != "open":
+        raise HTTPException(status_code=409, detail="Upload session already completed")
+
+    if len(completion.urls) > len(session["public_ids"]):
+        raise HTTPException(status_code=400, detail="More URLs than files signed for this upload session")
+
+    expected = {f"{session['folder']}/{public_id}" for public_id in session["public_ids"]}
+    seen = set()
+    for url in completion.urls:
+        asset = cloudinary_asset(url)
+        if asset is None or asset[0] != session["resource_type"] or asset[1] not in expected:
+            raise HTTPException(status_code=400, detail=f"URL does not belong to this upload session: {url}")
+        if asset[1] in seen:
+            raise HTTPException(status_code=400, detail=f"Duplicate upload URL: {url}")
+        seen.add(asset[1])
+
+    # Claim the session atomically so a retried callback cannot attach the images twice
+    event_id = completion.event_id or session.get("event_id")
+    if not await repos.uploads.claim(session_id, {"urls": completion.urls, "event_id": event_id}):
+        raise HTTPException(status_code=409, detail="Upload session already completed")
+
+    if event_id and completion.urls:
+        if not await repos.events.push_images(event_id, completion.urls):
+            await repos.uploads.reopen(session_id)
+            raise HTTPException(status_code=404, detail="Event not found")
+        invalidate_event_caches(event_id)
+        snapshot_publisher.schedule()
+
+    return {"message": "Upload session completed", "event_id": event_id, "attached": len(completion.urls) if event_id else 0}
+
+# Snapshot Routes
+SNAPSHOT_DIR = Path(os.getenv("SNAPSHOT_DIR", ROOT_DIR / "snapshots"))
+
+async def render_public_snapshot() -> dict:
+    """Render the public read endpoints exactly as the API serves them"""
+    fresh = await prime_public_caches()
+    payloads = {
+        "events": [EventSummary(**event).model_dump() for event in fresh["events"]],
+        "services": [Service(**service).model_dump() for service in fresh["services"]],
+    }
+    for section in fresh["sections"]:
+        payloads[f"content/{section['section_name']}"] = section
+    return payloads
+
+snapshot_publisher = SnapshotPublisher(
+    SNAPSHOT_DIR,
+    render_public_snapshot,
+    debounce_seconds=float(os.getenv("SNAPSHOT_DEBOUNCE_SECONDS", 2))
+)
+
+@api_router.post("/snapshots/publish")
+async def publish_snapshots(admin: dict = Depends(get_current_admin)):
+    """Render the public API into static snapshot files now (admin only)"""
+    return await snapshot_publisher.publish()
+
+@api_router.get("/snapshots/manifest")
+async def get_snapshot_manifest():
+    """Get the manifest of the latest published snapshot"""
+    manifest = await asyncio.to_thread(snapshot_publisher.read_manifest)
+    if manifest is None:
+        raise HTTPException(status_code=404, detail="No snapshot published yet")
+    return manifest
+
+# Background Jobs
+SCHEDULER_ENABLED = os.getenv("SCHEDULER_ENABLED", "true").lower() == "true"
+STALE_DATA_RETENTION_DAYS = int(os.getenv("STALE_DATA_RETENTION_DAYS", 30))
+
+scheduler = Scheduler(
+    leases=repos.leases,
+    lease_ttl_seconds=float(os.getenv("SCHEDULER_LEASE_TTL_SECONDS", 30))
+)
+
+enquiry_stats_state = {"stats": None, "computed_at": None}
+
+@scheduler.interval("refresh-public-caches", max(CACHE_TTL_SECONDS / 2, 5), jitter_seconds=5)
+async def refresh_public_caches():
+    await prime_public_caches()
+
+@scheduler.interval("enquiry-stats", 300, jitter_seconds=30, run_at_start=True)
+async def recompute_enquiry_stats():
+    enquiry_stats_state["stats"] = await repos.enquiries.stats()
+    enquiry_stats_state["computed_at"] = datetime.now(timezone.utc).isoformat()
+
+@scheduler.interval("retry-notifications", 60, jitter_seconds=10, leader_only=True)
+async def retry_failed_notifications():
+    now = datetime.now(timezone.utc)
+    for notification in await repos.notifications.due(now, 20):
+        attempts = notification["attempts"] + 1
+        try:
+            await asyncio.to_thread(email_sender.send, notification["params"])
+            await repos.notifications.update(notification["notification_id"], {
+                "status": "sent",
+                "attempts": attempts,
+                "updated_at": datetime.now(timezone.utc)
+            })
+        except Exception as e:
+            # Exponential backoff until the attempt budget runs out
+            give_up = attempts >= EMAIL_MAX_ATTEMPTS
+            await repos.notifications.update(notification["notification_id"], {
+                "status": "failed" if give_up else "pending",
+                "attempts": attempts,
+                "last_error": str(e),
+                "next_attempt_at": now + timedelta(seconds=EMAIL_RETRY_BASE_SECONDS * 2 ** attempts),
+                "updated_at": datetime.now(timezone.utc)
+            })
+
+@scheduler.cron("purge-stale-data", "30 3 * * *", jitter_seconds=300, leader_only=True)
+async def purge_stale_data():
+    cutoff = datetime.now(timezone.utc) - timedelta(days=STALE_DATA_RETENTION_DAYS)
+    sessions = await repos.uploads.purge_expired()
+    notifications = await repos.notifications.purge(cutoff)
+    logger.info(f"Purged {sessions} expired upload sessions and {notifications} old notifications")
+
+@api_router.get("/enquiries/stats")
+async def get_enquiry_stats(admin: dict = Depends(get_current_admin)):
+    """Enquiry totals by status and month, as last computed by the background job (admin only)"""
+    if enquiry_stats_state["stats"] is None:
+        await recompute_enquiry_stats()
+    return enquiry_stats_state
+
+# Metrics Routes
+@api_router.get("/metrics/queries")
+async def get_query_metrics(reset: bool = False, admin: dict = Depends(get_current_admin)):
+    """Per-operation repository timings since startup or the last reset (admin only)"""
+    metrics = {"backend": repos.backend, "operations": query_instrumentation.snapshot()}
+    if reset:
+        query_instrumentation.reset()
+    return metrics
+
+@api_router.get("/metrics/jobs")
+async def get_job_metrics(admin: dict = Depends(get_current_admin)):
+    """Background job run-time metrics for this worker (admin only)"""
+    return scheduler.metrics()
+
 # Settings Routes
 @api_router.get("/settings/admin-email")
 async def get_admin_email(admin: dict = Depends(get_current_admin)):
@@ -450,6 +1232,9 @@ async def root():
 # Include router
 app.include_router(api_router)
 
+# Published snapshots; point REACT_APP_SNAPSHOT_URL (or a CDN origin) at /snapshots
+app.mount("/snapshots", SnapshotFiles(directory=SNAPSHOT_DIR, check_dir=False), name="snapshots")
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
@@ -462,11 +1247,44 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
+# Health Routes
+@app.get("/health/live")
+async def health_live():
+    """Liveness probe: the process is up and serving"""
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def health_ready(response: Response):
+    """Readiness probe: Mongo reachable, pool warmed and public caches primed
+
+    Never waits on a warm-up: until one succeeds the probe kicks off a single
+    background retry and answers 503 straight away.
+    """
+    ping_ms = None
+    if not app_state["ready"]:
+        request_warm_up_retry()
+    else:
+        try:
+            started = time.perf_counter()
+            await asyncio.wait_for(repos.ping(), HEALTH_PING_TIMEOUT_SECONDS)
+            ping_ms = round((time.perf_counter() - started) * 1000, 1)
+        except Exception as e:
+            logger.error(f"Readiness ping failed: {str(e)}")
+
+    ready = app_state["ready"] and ping_ms is not None
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    return {
+        "status": "ready" if ready else "starting",
+        "warmed_at": app_state["warmed_at"],
+        "warmup_ms": app_state["warmup_ms"],
+        "ping_ms": ping_ms,
+        "index_failures": app_state["index_failures"],
+        "pool": repos.pool_state()
+    }
 
 @api_router.post("/services", response_model=Service)
 async def create_service(service_data: Service, admin: dict = Depends(get_current_admin)):
-    await db.services.insert_one(service_data.model_dump())
+    await repos.services.insert(service_data.model_dump())
     return service_data
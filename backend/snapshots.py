@@ -0,0 +1,215 @@
+"""
+Static snapshots of the public API for CDN/edge serving
+
+Each publish renders the public read endpoints into content-hashed JSON files
+(plus precompressed .gz, and .br when the optional brotli package is installed)
+and atomically swaps in a manifest.json mapping API paths to file names. Files
+referenced by the previous manifest are kept so in-flight clients never 404.
+Workers sharing an output directory publish one at a time under a file lock.
+SnapshotFiles serves the directory, preferring the precompressed variants.
+"""
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+from starlette.exceptions import HTTPException
+from starlette.datastructures import Headers
+from starlette.staticfiles import StaticFiles
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+LOCK_NAME = ".publish.lock"
+LOCK_POLL_SECONDS = 0.05
+
+
+def _write_atomic(path: Path, data: bytes):
+    # A unique temp name so concurrent writers never share (or delete) a temp file
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False) as tmp:
+        tmp.write(data)
+    try:
+        os.replace(tmp.name, path)
+    except BaseException:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+
+
+class SnapshotPublisher:
+    """Renders payloads to versioned static files and keeps a manifest of them"""
+
+    def __init__(self, output_dir: Path, render: Callable[[], Awaitable[Dict[str, object]]], debounce_seconds: float = 2.0):
+        self.output_dir = Path(output_dir)
+        self.render = render
+        self.debounce_seconds = debounce_seconds
+        self._lock = asyncio.Lock()
+        self._pending: Optional[asyncio.Task] = None
+        self._publishing: Set[asyncio.Task] = set()
+
+    def read_manifest(self) -> Optional[dict]:
+        path = self.output_dir / MANIFEST_NAME
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())
+
+    async def publish(self) -> dict:
+        """Render every payload now and swap in a new manifest"""
+        async with self._lock:
+            lock_file = await self._acquire_file_lock()
+            try:
+                # Render under the lock too, so a slower worker never publishes older data last
+                payloads = await self.render()
+                write = asyncio.ensure_future(asyncio.to_thread(self._write_snapshot, payloads))
+                try:
+                    return await asyncio.shield(write)
+                except asyncio.CancelledError:
+                    # The writer thread cannot be stopped; hold both locks until it
+                    # finishes so no other publish prunes files it is still writing
+                    await asyncio.wait([write])
+                    raise
+            finally:
+                lock_file.close()
+
+    async def _acquire_file_lock(self):
+        """Take the cross-process publish lock, polling so cancellation stays safe"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.output_dir / LOCK_NAME, "a")
+        if fcntl is None:
+            return lock_file
+        try:
+            while True:
+                try:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return lock_file
+                except BlockingIOError:
+                    await asyncio.sleep(LOCK_POLL_SECONDS)
+        except BaseException:
+            lock_file.close()
+            raise
+
+    def schedule(self):
+        """Publish shortly after the last call, coalescing bursts of admin writes
+
+        Only the debounce wait is ever cancelled; a publish that has started
+        runs to completion and a later call queues another one behind it.
+        """
+        if self._pending is not None and not self._pending.done():
+            self._pending.cancel()
+        self._pending = asyncio.create_task(self._debounce())
+
+    async def _debounce(self):
+        try:
+            await asyncio.sleep(self.debounce_seconds)
+        except asyncio.CancelledError:
+            return
+        task = asyncio.create_task(self._publish_logged())
+        self._publishing.add(task)
+        task.add_done_callback(self._publishing.discard)
+
+    async def _publish_logged(self):
+        try:
+            await self.publish()
+        except Exception as e:
+            logger.error(f"Snapshot publish failed: {str(e)}")
+
+    def _write_snapshot(self, payloads: Dict[str, object]) -> dict:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        previous = self.read_manifest() or {"version": 0, "files": {}}
+
+        files = {}
+        for name, payload in payloads.items():
+            body = json.dumps(payload, separators=(",", ":"), sort_keys=True, ensure_ascii=False).encode("utf-8")
+            digest = hashlib.sha256(body).hexdigest()
+            filename = f"{name.replace('/', '-')}.{digest[:16]}.json"
+            path = self.output_dir / filename
+
+            entry = {"file": filename, "sha256": digest, "bytes": len(body), "encodings": ["gzip"]}
+            if not path.exists():
+                _write_atomic(path, body)
+                _write_atomic(path.with_name(filename + ".gz"), gzip.compress(body, compresslevel=9, mtime=0))
+                if brotli is not None:
+                    _write_atomic(path.with_name(filename + ".br"), brotli.compress(body))
+            if brotli is not None:
+                entry["encodings"].append("br")
+            files[name] = entry
+
+        changed = {name: entry["sha256"] for name, entry in files.items()} != {
+            name: entry["sha256"] for name, entry in previous["files"].items()
+        }
+        if changed:
+            version = previous["version"] + 1
+            previous_files = sorted({entry["file"] for entry in previous["files"].values()})
+        else:
+            version = previous["version"]
+            previous_files = previous.get("previous_files", [])
+
+        manifest = {
+            "version": version,
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "files": files,
+            "previous_files": previous_files,
+        }
+        _write_atomic(self.output_dir / MANIFEST_NAME, json.dumps(manifest, indent=2).encode("utf-8"))
+        self._prune(manifest)
+
+        logger.info(f"Published snapshot version {manifest['version']} ({len(files)} files)")
+        return manifest
+
+    def _prune(self, manifest: dict):
+        keep = {entry["file"] for entry in manifest["files"].values()} | set(manifest["previous_files"])
+        for path in self.output_dir.glob("*.json*"):
+            if path.name == MANIFEST_NAME or path.name.endswith(".tmp"):
+                continue
+            base_name = path.name.removesuffix(".gz").removesuffix(".br")
+            if base_name not in keep:
+                path.unlink(missing_ok=True)
+
+
+class SnapshotFiles(StaticFiles):
+    """Static serving for the snapshot directory
+
+    Content-hashed files are immutable and served from their .br/.gz sibling
+    when the client accepts it; the manifest is always revalidated.
+    """
+
+    async def get_response(self, path: str, scope):
+        if path == MANIFEST_NAME:
+            response = await super().get_response(path, scope)
+            response.headers["Cache-Control"] = "no-cache"
+            return response
+
+        accepted = Headers(scope=scope).get("accept-encoding", "")
+        if path.endswith(".json"):
+            for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+                if encoding not in accepted:
+                    continue
+                try:
+                    response = await super().get_response(path + suffix, scope)
+                except HTTPException:
+                    continue
+                response.headers["Content-Encoding"] = encoding
+                response.headers["Content-Type"] = "application/json"
+                return self._immutable(response)
+        return self._immutable(await super().get_response(path, scope))
+
+    @staticmethod
+    def _immutable(response):
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
@@ -11,9 +11,9 @@ class AmbicaWeddingAPITester:
         self.tests_passed = 0
         self.failed_tests = []
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None):
+    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None, api=True):
         """Run a single API test"""
-        url = f"{self.base_url}/api/{endpoint}"
+        url = f"{self.base_url}/api/{endpoint}" if api else f"{self.base_url}/{endpoint}"
         test_headers = {'Content-Type': 'application/json'}
         if self.token:
             test_headers['Authorization'] = f'Bearer {self.token}'
@@ -67,6 +67,14 @@ class AmbicaWeddingAPITester:
         """Test root API endpoint"""
         return self.run_test("Root API", "GET", "", 200)
 
+    def test_health_endpoints(self):
+        """Test liveness and readiness probes"""
+        tests = [
+            self.run_test("Health Live", "GET", "health/live", 200, api=False)[0],
+            self.run_test("Health Ready", "GET", "health/ready", 200, api=False)[0]
+        ]
+        return all(tests)
+
     def test_admin_login(self):
         """Test admin login"""
         login_data = {
@@ -99,6 +107,42 @@ class AmbicaWeddingAPITester:
         """Test get events with category filter"""
         return self.run_test("Get Events (Wedding)", "GET", "events?category=wedding", 200)[0]
 
+    def test_get_event_detail(self, event_id):
+        """Test get full event detail"""
+        if not event_id:
+            print("❌ Skipping event detail test - no event_id")
+            return False
+
+        success, response = self.run_test("Get Event Detail", "GET", f"events/{event_id}", 200)
+        return success and 'images' in response and 'description' in response
+
+    def test_get_event_for_edit(self, event_id):
+        """Test uncached event detail for the edit form (admin only)"""
+        if not self.token or not event_id:
+            print("❌ Skipping event edit detail test - no token or event_id")
+            return False
+
+        success, response = self.run_test("Get Event For Edit", "GET", f"admin/events/{event_id}", 200)
+        return success and 'images' in response
+
+    def test_get_events_for_admin(self):
+        """Test uncached event list for the admin page (admin only)"""
+        if not self.token:
+            print("❌ Skipping admin event list test - no token")
+            return False
+
+        success, response = self.run_test("Get Events For Admin", "GET", "admin/events", 200)
+        return success and all('event_type' in event and 'description' in event for event in response)
+
+    def test_get_events_date_range(self):
+        """Test get events within a date range"""
+        return self.run_test("Get Events (2024)", "GET", "events?date_from=2024-01-01&date_to=2024-12-31", 200)[0]
+
+    def test_get_showcase(self):
+        """Test faceted showcase browsing"""
+        success, response = self.run_test("Get Showcase (Wedding)", "GET", "showcase?category=Wedding", 200)
+        return success and 'events' in response and 'facets' in response
+
     def test_create_event(self):
         """Test create new event (admin only)"""
         if not self.token:
@@ -162,6 +206,15 @@ class AmbicaWeddingAPITester:
         
         return self.run_test("Get Enquiries", "GET", "enquiries", 200)[0]
 
+    def test_get_enquiries_date_range(self):
+        """Test get enquiries submitted this month (admin only)"""
+        if not self.token:
+            print("❌ Skipping enquiry date range test - no token")
+            return False
+
+        month_start = datetime.now().strftime("%Y-%m-01")
+        return self.run_test("Get Enquiries (This Month)", "GET", f"enquiries?created_from={month_start}", 200)[0]
+
     def test_update_enquiry_status(self, enquiry_id):
         """Test update enquiry status"""
         if not self.token or not enquiry_id:
@@ -179,6 +232,12 @@ class AmbicaWeddingAPITester:
         ]
         return all(tests)
 
+    def test_get_content_bulk(self):
+        """Test fetching several content sections in one request"""
+        success, response = self.run_test("Get Content (Bulk)", "GET", "content?sections=homepage,about", 200)
+        sections = response.get('sections', {})
+        return success and 'homepage' in sections and 'about' in sections
+
     def test_update_content(self):
         """Test update content (admin only)"""
         if not self.token:
@@ -193,6 +252,23 @@ class AmbicaWeddingAPITester:
         }
         return self.run_test("Update Content", "PUT", "content/test", 200, data=content_data)[0]
 
+    def test_content_versions(self):
+        """Test listing content versions (admin only)"""
+        if not self.token:
+            print("❌ Skipping content versions test - no token")
+            return False
+
+        return self.run_test("Get Content Versions", "GET", "content/test/versions", 200)[0]
+
+    def test_stale_content_update(self):
+        """Test that saving on top of an outdated version is rejected (admin only)"""
+        if not self.token:
+            print("❌ Skipping stale content update test - no token")
+            return False
+
+        content_data = {"content": {"test_field": "Stale edit"}, "version": 0}
+        return self.run_test("Reject Stale Content Update", "PUT", "content/test", 409, data=content_data)[0]
+
     def test_cloudinary_signature(self):
         """Test Cloudinary signature generation (admin only)"""
         if not self.token:
@@ -201,6 +277,71 @@ class AmbicaWeddingAPITester:
         
         return self.run_test("Get Cloudinary Signature", "GET", "cloudinary/signature", 200)[0]
 
+    def test_publish_snapshots(self):
+        """Test on-demand snapshot publishing (admin only)"""
+        if not self.token:
+            print("❌ Skipping snapshot publish test - no token")
+            return False
+
+        success, response = self.run_test("Publish Snapshots", "POST", "snapshots/publish", 200)
+        if not success or 'files' not in response:
+            return False
+        return self.run_test("Get Snapshot Manifest", "GET", "snapshots/manifest", 200)[0]
+
+    def test_cloudinary_upload_session(self):
+        """Test batched upload signatures and session completion (admin only)"""
+        if not self.token:
+            print("❌ Skipping Cloudinary upload session test - no token")
+            return False
+
+        session_data = {"count": 3, "resource_type": "image"}
+        success, response = self.run_test("Create Upload Session", "POST", "cloudinary/upload-session", 200, data=session_data)
+        if not success or len(response.get('uploads', [])) != 3:
+            return False
+
+        session_id = response['session_id']
+        return self.run_test("Complete Upload Session", "POST", f"cloudinary/upload-session/{session_id}/complete", 200, data={"urls": []})[0]
+
+    def test_query_metrics(self):
+        """Test repository query timings (admin only)"""
+        if not self.token:
+            print("❌ Skipping query metrics test - no token")
+            return False
+
+        success, response = self.run_test("Get Query Metrics", "GET", "metrics/queries", 200)
+        return success and 'operations' in response
+
+    def test_enquiry_customers(self):
+        """Test enquiries grouped by customer (admin only)"""
+        if not self.token:
+            print("❌ Skipping enquiry customers test - no token")
+            return False
+
+        success, response = self.run_test("Get Enquiry Customers", "GET", "enquiries/customers", 200)
+        if not success or not response:
+            return success
+
+        customer_id = response[0]['customer_id']
+        return self.run_test("Get Customer Enquiries", "GET", f"enquiries/customers/{customer_id}", 200)[0]
+
+    def test_job_metrics(self):
+        """Test background job metrics (admin only)"""
+        if not self.token:
+            print("❌ Skipping job metrics test - no token")
+            return False
+
+        success, response = self.run_test("Get Job Metrics", "GET", "metrics/jobs", 200)
+        return success and 'jobs' in response
+
+    def test_enquiry_stats(self):
+        """Test precomputed enquiry stats (admin only)"""
+        if not self.token:
+            print("❌ Skipping enquiry stats test - no token")
+            return False
+
+        success, response = self.run_test("Get Enquiry Stats", "GET", "enquiries/stats", 200)
+        return success and 'by_status' in (response.get('stats') or {})
+
     def test_admin_email_settings(self):
         """Test admin email settings"""
         if not self.token:
@@ -218,10 +359,14 @@ def main():
     # Test sequence
     print("\n📋 Testing Public Endpoints...")
     tester.test_root_endpoint()
+    tester.test_health_endpoints()
     tester.test_get_services()
     tester.test_get_events()
     tester.test_get_events_with_filter()
+    tester.test_get_events_date_range()
+    tester.test_get_showcase()
     tester.test_get_content()
+    tester.test_get_content_bulk()
     
     print("\n🔐 Testing Authentication...")
     if not tester.test_admin_login():
@@ -234,23 +379,37 @@ def main():
     print("\n📝 Testing Enquiry System...")
     enquiry_success, enquiry_id = tester.test_create_enquiry()
     tester.test_get_enquiries()
+    tester.test_get_enquiries_date_range()
     if enquiry_id:
         tester.test_update_enquiry_status(enquiry_id)
     
     print("\n🎪 Testing Event Management...")
     event_success, event_id = tester.test_create_event()
     if event_id:
+        tester.test_get_event_detail(event_id)
+        tester.test_get_event_for_edit(event_id)
+        tester.test_get_events_for_admin()
         tester.test_update_event(event_id)
         tester.test_delete_event(event_id)
     
     print("\n📄 Testing Content Management...")
     tester.test_update_content()
+    tester.test_content_versions()
+    tester.test_stale_content_update()
     
     print("\n☁️ Testing Cloudinary Integration...")
     tester.test_cloudinary_signature()
+    tester.test_cloudinary_upload_session()
+    
+    print("\n🗂️ Testing Snapshots...")
+    tester.test_publish_snapshots()
     
     print("\n⚙️ Testing Settings...")
     tester.test_admin_email_settings()
+    tester.test_query_metrics()
+    tester.test_enquiry_customers()
+    tester.test_job_metrics()
+    tester.test_enquiry_stats()
     
     # Print final results
     print("\n" + "=" * 50)
@@ -28,4 +28,65 @@ export const uploadToCloudinary = async (file, resourceType = 'image') => {
     console.error('Cloudinary upload error:', error);
     throw error;
   }
-};
\ No newline at end of file
+};
+
+// Matches UPLOAD_SESSION_MAX_FILES on the backend
+const MAX_FILES_PER_SESSION = 100;
+
+const uploadSession = async (files, resourceType, eventId) => {
+  const sessionResponse = await api.post('/cloudinary/upload-session', {
+    count: files.length,
+    resource_type: resourceType,
+    event_id: eventId,
+  });
+  const { session_id, timestamp, cloud_name, api_key, folder, uploads } = sessionResponse.data;
+  const uploadUrl = `https://api.cloudinary.com/v1_1/${cloud_name}/${resourceType}/upload`;
+
+  const urls = await Promise.all(
+    files.map(async (file, index) => {
+      const { public_id, signature } = uploads[index];
+      const formData = new FormData();
+      formData.append('file', file);
+      formData.append('api_key', api_key);
+      formData.append('timestamp', timestamp);
+      formData.append('signature', signature);
+      formData.append('folder', folder);
+      formData.append('public_id', public_id);
+
+      const uploadResponse = await fetch(uploadUrl, {
+        method: 'POST',
+        body: formData,
+      });
+
+      if (!uploadResponse.ok) {
+        throw new Error('Upload failed');
+      }
+
+      const result = await uploadResponse.json();
+      return result.secure_url;
+    })
+  );
+
+  await api.post(`/cloudinary/upload-session/${session_id}/complete`, {
+    urls,
+    event_id: eventId,
+  });
+  return urls;
+};
+
+// Uploads several files with one signing round-trip per 100 files. When eventId
+// is given the backend attaches the uploaded URLs to that event straight away,
+// so forms that only save on submit should leave it out.
+export const uploadManyToCloudinary = async (files, resourceType = 'image', eventId = null) => {
+  try {
+    const urls = [];
+    for (let start = 0; start < files.length; start += MAX_FILES_PER_SESSION) {
+      const chunk = files.slice(start, start + MAX_FILES_PER_SESSION);
+      urls.push(...(await uploadSession(chunk, resourceType, eventId)));
+    }
+    return urls;
+  } catch (error) {
+    console.error('Cloudinary upload error:', error);
+    throw error;
+  }
+};
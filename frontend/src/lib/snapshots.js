@@ -0,0 +1,41 @@
+import api from './api';
+
+// Base URL of the published static snapshots (CDN or static host). When unset,
+// or when a snapshot is missing, public reads go straight to the API.
+const SNAPSHOT_URL = process.env.REACT_APP_SNAPSHOT_URL;
+
+let manifestPromise = null;
+
+const loadManifest = () => {
+  if (!manifestPromise) {
+    manifestPromise = fetch(`${SNAPSHOT_URL}/manifest.json`, { cache: 'no-cache' })
+      .then((response) => {
+        if (!response.ok) throw new Error('Snapshot manifest unavailable');
+        return response.json();
+      })
+      .catch((error) => {
+        manifestPromise = null;
+        throw error;
+      });
+  }
+  return manifestPromise;
+};
+
+// Resolves to an axios-like `{ data }` for a public API path such as '/services'
+export const getPublic = async (path) => {
+  if (SNAPSHOT_URL) {
+    try {
+      const manifest = await loadManifest();
+      const entry = manifest.files[path.replace(/^\//, '')];
+      if (entry) {
+        const response = await fetch(`${SNAPSHOT_URL}/${entry.file}`);
+        if (response.ok) {
+          return { data: await response.json() };
+        }
+      }
+    } catch (error) {
+      console.warn('Snapshot unavailable, falling back to API:', error);
+    }
+  }
+  return api.get(path);
+};
@@ -3,7 +3,7 @@ import { motion } from 'framer-motion';
 import { Heart, Award, Users } from 'lucide-react';
 import Navbar from '@/components/Navbar';
 import Footer from '@/components/Footer';
-import api from '@/lib/api';
+import { getPublic } from '@/lib/snapshots';
 
 const AboutPage = () => {
   const [content, setContent] = useState({});
@@ -12,7 +12,7 @@ const AboutPage = () => {
   useEffect(() => {
     const fetchContent = async () => {
       try {
-        const response = await api.get('/content/about');
+        const response = await getPublic('/content/about');
         setContent(response.data.content || {});
       } catch (error) {
         console.error('Error fetching content:', error);
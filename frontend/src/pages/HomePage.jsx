@@ -5,7 +5,7 @@ import { ArrowRight, Sparkles, Heart, Star } from 'lucide-react';
 import Navbar from '@/components/Navbar';
 import Footer from '@/components/Footer';
 import { Button } from '@/components/ui/button';
-import api from '@/lib/api';
+import { getPublic } from '@/lib/snapshots';
 
 const HomePage = () => {
   const [content, setContent] = useState(null);
@@ -17,9 +17,9 @@ const HomePage = () => {
     const fetchData = async () => {
       try {
         const [contentRes, servicesRes, eventsRes] = await Promise.all([
-          api.get('/content/homepage'),
-          api.get('/services'),
-          api.get('/events')
+          getPublic('/content/homepage'),
+          getPublic('/services'),
+          getPublic('/events')
         ]);
         setContent(contentRes.data.content || {});
         setServices(servicesRes.data.slice(0, 3));
@@ -238,7 +238,7 @@ const HomePage = () => {
                 >
                   <div className="aspect-[3/4] overflow-hidden">
                     <img
-                      src={event.images[0]}
+                      src={event.cover_image}
                       alt={event.title}
                       className="w-full h-full object-cover group-hover:scale-110 transition-transform duration-500"
                     />
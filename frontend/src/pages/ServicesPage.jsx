@@ -2,7 +2,7 @@ import { useEffect, useState } from 'react';
 import { motion } from 'framer-motion';
 import Navbar from '@/components/Navbar';
 import Footer from '@/components/Footer';
-import api from '@/lib/api';
+import { getPublic } from '@/lib/snapshots';
 
 const ServicesPage = () => {
   const [services, setServices] = useState([]);
@@ -11,7 +11,7 @@ const ServicesPage = () => {
   useEffect(() => {
     const fetchServices = async () => {
       try {
-        const response = await api.get('/services');
+        const response = await getPublic('/services');
         setServices(response.data);
       } catch (error) {
         console.error('Error fetching services:', error);
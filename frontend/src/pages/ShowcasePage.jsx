@@ -7,11 +7,17 @@ import { Button } from '@/components/ui/button';
 import api from '@/lib/api';
 import { Dialog, DialogContent } from '@/components/ui/dialog';
 
+// Matches the API's default page, which the backend keeps warm in its cache
+const PAGE_SIZE = 60;
+
 const ShowcasePage = () => {
   const [events, setEvents] = useState([]);
-  const [filteredEvents, setFilteredEvents] = useState([]);
+  const [total, setTotal] = useState(0);
+  const [categoryFacets, setCategoryFacets] = useState([]);
   const [selectedCategory, setSelectedCategory] = useState('all');
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const latestRequest = useRef(0);
 
   const [isGalleryOpen, setIsGalleryOpen] = useState(false);
   const [selectedEvent, setSelectedEvent] = useState(null);
@@ -21,41 +27,59 @@ const ShowcasePage = () => {
   const touchEndX = useRef(0);
 
   // ================= FETCH EVENTS =================
-  useEffect(() => {
-    const fetchEvents = async () => {
-      try {
-        const response = await api.get('/events');
-        setEvents(response.data);
-        setFilteredEvents(response.data);
-      } catch (error) {
-        console.error('Error fetching events:', error);
-      } finally {
+  const fetchShowcase = useCallback(async (category, skip) => {
+    // Responses for a category the visitor has already left are dropped
+    const requestId = ++latestRequest.current;
+    const params = { skip, limit: PAGE_SIZE };
+    if (category !== 'all') params.category = category;
+
+    try {
+      const response = await api.get('/showcase', { params });
+      if (requestId !== latestRequest.current) return;
+      setEvents((prev) => (skip === 0 ? response.data.events : [...prev, ...response.data.events]));
+      setTotal(response.data.total);
+      setCategoryFacets(response.data.facets.category);
+    } catch (error) {
+      console.error('Error fetching events:', error);
+    } finally {
+      if (requestId === latestRequest.current) {
         setLoading(false);
+        setLoadingMore(false);
       }
-    };
-    fetchEvents();
+    }
   }, []);
 
+  useEffect(() => {
+    setLoading(true);
+    setLoadingMore(false);
+    fetchShowcase(selectedCategory, 0);
+  }, [selectedCategory, fetchShowcase]);
+
+  const loadMore = () => {
+    setLoadingMore(true);
+    fetchShowcase(selectedCategory, events.length);
+  };
+
   // ================= FILTER =================
   const categories = [
     'all',
-    ...new Set(events.map((event) => event.category))
+    ...categoryFacets.map((facet) => facet.value)
   ];
 
   const handleFilter = (category) => {
     setSelectedCategory(category);
-    if (category === 'all') {
-      setFilteredEvents(events);
-    } else {
-      setFilteredEvents(events.filter((event) => event.category === category));
-    }
   };
 
   // ================= GALLERY =================
-  const openGallery = (event) => {
-    setSelectedEvent(event);
-    setCurrentIndex(0);
-    setIsGalleryOpen(true);
+  const openGallery = async (summary) => {
+    try {
+      const response = await api.get(`/events/${summary.event_id}`);
+      setSelectedEvent(response.data);
+      setCurrentIndex(0);
+      setIsGalleryOpen(true);
+    } catch (error) {
+      console.error('Error fetching event:', error);
+    }
   };
 
   const nextImage = useCallback(() => {
@@ -165,23 +189,23 @@ const ShowcasePage = () => {
             <div className="text-center py-12">
               <p className="text-muted-foreground">Loading events...</p>
             </div>
-          ) : filteredEvents.length === 0 ? (
+          ) : events.length === 0 ? (
             <div className="text-center py-12">
               <p className="text-muted-foreground">No events found</p>
             </div>
           ) : (
             <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 gap-8">
-              {filteredEvents.map((event, index) => (
+              {events.map((event, index) => (
                 <motion.div
                   key={event.event_id}
                   initial={{ opacity: 0, scale: 0.95 }}
                   whileInView={{ opacity: 1, scale: 1 }}
-                  transition={{ duration: 0.5, delay: index * 0.05 }}
+                  transition={{ duration: 0.5, delay: (index % PAGE_SIZE) * 0.05 }}
                   className="group relative overflow-hidden rounded-lg bg-muted cursor-pointer shadow-sm hover:shadow-xl"
                 >
                   <div className="aspect-[3/4] overflow-hidden">
                     <img
-                      src={event.images?.[0]}
+                      src={event.cover_image}
                       alt={event.title}
                       className="w-full h-full object-cover group-hover:scale-110 transition-transform duration-500"
                     />
@@ -192,13 +216,26 @@ const ShowcasePage = () => {
                       onClick={() => openGallery(event)}
                       className="bg-white/90 px-3 py-1 rounded-full text-xs font-medium text-primary"
                     >
-                      {event.images?.length || 0} photos
+                      {event.image_count || 0} photos
                     </button>
                   </div>
                 </motion.div>
               ))}
             </div>
           )}
+
+          {!loading && events.length < total && (
+            <div className="text-center mt-12">
+              <Button
+                onClick={loadMore}
+                disabled={loadingMore}
+                variant="outline"
+                className="rounded-full hover:border-primary hover:text-primary"
+              >
+                {loadingMore ? 'Loading...' : `Load more (${total - events.length} remaining)`}
+              </Button>
+            </div>
+          )}
         </div>
       </section>
 
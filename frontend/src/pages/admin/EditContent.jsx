@@ -14,6 +14,8 @@ const EditContent = () => {
   const [loading, setLoading] = useState(true);
   const [saving, setSaving] = useState(false);
   const [homepageContent, setHomepageContent] = useState({});
+  // Versions the forms were loaded at, sent back so concurrent edits are rejected
+  const [versions, setVersions] = useState({ homepage: 0, about: 0 });
   const [aboutContent, setAboutContent] = useState({
     title: '',
     subtitle: '',
@@ -27,14 +29,15 @@ const EditContent = () => {
 
   const fetchContent = async () => {
     try {
-      const [homepageRes, aboutRes] = await Promise.all([
-        api.get('/content/homepage'),
-        api.get('/content/about')
-      ]);
+      const response = await api.get('/admin/content', {
+        params: { sections: 'homepage,about' }
+      });
+      const { homepage, about } = response.data.sections;
 
-      setHomepageContent(homepageRes.data.content || {});
+      setVersions({ homepage: homepage.version || 0, about: about.version || 0 });
+      setHomepageContent(homepage.content || {});
 
-      const aboutData = aboutRes.data.content || {};
+      const aboutData = about.content || {};
       setAboutContent({
         title: aboutData.title || '',
         subtitle: aboutData.subtitle || '',
@@ -50,6 +53,19 @@ const EditContent = () => {
     }
   };
 
+  const saveSection = async (section, content) => {
+    const response = await api.put(`/content/${section}`, {
+      content,
+      version: versions[section]
+    });
+    setVersions((prev) => ({ ...prev, [section]: response.data.version }));
+  };
+
+  const saveErrorMessage = (error, fallback) =>
+    error.response?.status === 409
+      ? 'This content was changed by someone else. Reload the page to get the latest version.'
+      : fallback;
+
   /* ---------------- HOMEPAGE ---------------- */
 
   const handleHomepageChange = (field, value) => {
@@ -59,10 +75,10 @@ const EditContent = () => {
   const saveHomepageContent = async () => {
     setSaving(true);
     try {
-      await api.put('/content/homepage', { content: homepageContent });
+      await saveSection('homepage', homepageContent);
       toast.success('Homepage content updated successfully');
     } catch (error) {
-      toast.error('Failed to save homepage content');
+      toast.error(saveErrorMessage(error, 'Failed to save homepage content'));
     } finally {
       setSaving(false);
     }
@@ -113,10 +129,10 @@ const EditContent = () => {
   const saveAboutContent = async () => {
     setSaving(true);
     try {
-      await api.put('/content/about', { content: aboutContent });
+      await saveSection('about', aboutContent);
       toast.success('About page updated successfully');
     } catch (error) {
-      toast.error('Failed to save about content');
+      toast.error(saveErrorMessage(error, 'Failed to save about content'));
     } finally {
       setSaving(false);
     }
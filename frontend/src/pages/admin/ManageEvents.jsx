@@ -15,7 +15,7 @@ import {
 } from '@/components/ui/dialog';
 import { toast } from 'sonner';
 import api from '@/lib/api';
-import { uploadToCloudinary } from '@/lib/cloudinary';
+import { uploadManyToCloudinary } from '@/lib/cloudinary';
 
 const ManageEvents = () => {
   const navigate = useNavigate();
@@ -40,7 +40,7 @@ const ManageEvents = () => {
 
   const fetchEvents = async () => {
     try {
-      const response = await api.get('/events');
+      const response = await api.get('/admin/events');
       setEvents(response.data);
     } catch (error) {
       console.error('Error fetching events:', error);
@@ -63,8 +63,8 @@ const ManageEvents = () => {
 
     setUploading(true);
     try {
-      const uploadPromises = files.map(file => uploadToCloudinary(file, 'image'));
-      const imageUrls = await Promise.all(uploadPromises);
+      // Images are only attached when the form is saved, so cancelling discards them
+      const imageUrls = await uploadManyToCloudinary(files, 'image');
       setFormData({
         ...formData,
         images: [...formData.images, ...imageUrls]
@@ -106,18 +106,25 @@ const ManageEvents = () => {
     }
   };
 
-  const handleEdit = (event) => {
-    setEditingEvent(event);
-    setFormData({
-      title: event.title,
-      location: event.location,
-      event_type: event.event_type,
-      category: event.category,
-      description: event.description,
-      date: event.date,
-      images: event.images
-    });
-    setIsDialogOpen(true);
+  const handleEdit = async (summary) => {
+    try {
+      const response = await api.get(`/admin/events/${summary.event_id}`);
+      const event = response.data;
+      setEditingEvent(event);
+      setFormData({
+        title: event.title,
+        location: event.location,
+        event_type: event.event_type,
+        category: event.category,
+        description: event.description,
+        date: event.date,
+        images: event.images
+      });
+      setIsDialogOpen(true);
+    } catch (error) {
+      console.error('Error fetching event:', error);
+      toast.error('Failed to load event');
+    }
   };
 
   const handleDelete = async (eventId) => {
@@ -341,9 +348,9 @@ const ManageEvents = () => {
                 data-testid={`event-card-${event.event_id}`}
                 className="bg-white rounded-lg border border-border overflow-hidden shadow-sm hover:shadow-md transition-shadow"
               >
-                {event.images.length > 0 && (
+                {event.cover_image && (
                   <img
-                    src={event.images[0]}
+                    src={event.cover_image}
                     alt={event.title}
                     className="w-full h-48 object-cover"
                   />
@@ -362,6 +369,9 @@ const ManageEvents = () => {
                     <span className="text-xs bg-secondary text-secondary-foreground px-2 py-1 rounded">
                       {event.category}
                     </span>
+                    <span className="text-xs text-muted-foreground">
+                      {event.date} · {event.image_count} photos
+                    </span>
                   </div>
                   <p className="text-sm text-muted-foreground line-clamp-2">
                     {event.description}
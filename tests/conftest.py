@@ -0,0 +1,38 @@
+"""
+Shared fixtures: the API runs on the in-memory data backend, so these tests need
+no MongoDB, Cloudinary or Resend.
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+# Set before server.py is imported; load_dotenv does not override these
+os.environ["DATA_BACKEND"] = "memory"
+os.environ["JWT_SECRET"] = "test-secret"
+os.environ["SCHEDULER_ENABLED"] = "false"
+os.environ["SNAPSHOT_DIR"] = tempfile.mkdtemp(prefix="snapshots-")
+os.environ.pop("ADMIN_EMAIL", None)
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+    from server import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def admin_headers(client):
+    credentials = {"email": "admin@example.com", "password": "secret-password"}
+    client.post("/api/auth/register", json={**credentials, "name": "Admin"})
+    response = client.post("/api/auth/login", json=credentials)
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
@@ -0,0 +1,83 @@
+import pytest
+
+from server import apply_patch, json_diff
+
+
+@pytest.mark.parametrize("old, new", [
+    ({}, {"title": "Welcome"}),
+    ({"title": "Welcome", "hero": {"image": "a.jpg"}}, {"title": "Welcome", "hero": {"image": "b.jpg"}}),
+    ({"values": [1, 2, 3], "extra": True}, {"values": [3]}),
+    ({"a/b": 1, "c~d": {"e": 2}}, {"a/b": 2, "c~d": {}}),
+    ({"nested": {"deep": {"x": 1}}}, {"nested": "flattened"}),
+])
+def test_json_diff_round_trip(old, new):
+    assert apply_patch(old, json_diff(old, new)) == new
+    assert apply_patch(new, json_diff(new, old)) == old
+
+
+def test_json_diff_of_equal_documents_is_empty():
+    assert json_diff({"a": [1, {"b": 2}]}, {"a": [1, {"b": 2}]}) == []
+
+
+def test_apply_patch_does_not_mutate_input():
+    old = {"hero": {"image": "a.jpg"}}
+    apply_patch(old, json_diff(old, {"hero": {"image": "b.jpg"}}))
+    assert old == {"hero": {"image": "a.jpg"}}
+
+
+def test_save_versions_and_roll_back(client, admin_headers):
+    first = client.put("/api/content/rollback-test", json={"content": {"title": "One"}, "version": 0}, headers=admin_headers)
+    assert first.status_code == 200
+    assert first.json()["version"] == 1
+
+    second = client.put("/api/content/rollback-test", json={"content": {"title": "Two", "subtitle": "New"}, "version": 1}, headers=admin_headers)
+    assert second.json()["version"] == 2
+
+    versions = client.get("/api/content/rollback-test/versions", headers=admin_headers).json()
+    assert [version["version"] for version in versions] == [2, 1]
+
+    rolled_back = client.post("/api/content/rollback-test/rollback/1", headers=admin_headers)
+    assert rolled_back.status_code == 200
+    assert rolled_back.json()["content"] == {"title": "One"}
+    assert rolled_back.json()["version"] == 3
+
+
+def test_stale_edit_is_rejected(client, admin_headers):
+    client.put("/api/content/stale-test", json={"content": {"title": "One"}}, headers=admin_headers)
+    stale = client.put("/api/content/stale-test", json={"content": {"title": "Other"}, "version": 0}, headers=admin_headers)
+    assert stale.status_code == 409
+
+    by_etag = client.put(
+        "/api/content/stale-test",
+        json={"content": {"title": "Two"}},
+        headers={**admin_headers, "If-Match": 'W/"stale-test.1"'}
+    )
+    assert by_etag.status_code == 200
+
+
+def test_content_etag_revalidation(client):
+    response = client.get("/api/content/homepage")
+    etag = response.headers["ETag"]
+    assert client.get("/api/content/homepage", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_content_update_targets_changed_paths():
+    from repositories import _content_update
+
+    old = {"title": "Welcome", "hero": {"image": "a.jpg", "caption": "Old"}, "stale": True}
+    new = {"title": "Welcome", "hero": {"image": "b.jpg", "caption": "Old"}, "values": [1, 2]}
+    assert _content_update(json_diff(old, new)) == {
+        "$set": {"content.hero.image": "b.jpg", "content.values": [1, 2]},
+        "$unset": {"content.stale": ""},
+    }
+
+
+@pytest.mark.parametrize("old, new", [
+    ({"a": 1}, []),
+    ({"a.b": 1}, {"a.b": 2}),
+    ({"$x": 1}, {"$x": 2}),
+])
+def test_content_update_falls_back_to_full_writes(old, new):
+    from repositories import _content_update
+
+    assert _content_update(json_diff(old, new)) is None
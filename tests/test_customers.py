@@ -0,0 +1,86 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from repositories import MemoryRepositories, _pick_customer
+from server import normalize_email, normalize_phone
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("+91 98765 43210", "9876543210"),
+    ("098765-43210", "9876543210"),
+    ("(987) 654-3210", "9876543210"),
+    ("12345", "12345"),
+    ("no digits", None),
+    (None, None),
+])
+def test_normalize_phone(raw, expected):
+    assert normalize_phone(raw) == expected
+
+
+def test_normalize_email():
+    assert normalize_email("  Bride@Example.COM ") == "bride@example.com"
+    assert normalize_email("") is None
+
+
+def test_pick_customer_prefers_both_keys_then_phone():
+    by_phone = {"customer_id": "phone", "phone_keys": ["111"], "email_keys": ["p@x.com"]}
+    by_email = {"customer_id": "email", "phone_keys": ["222"], "email_keys": ["e@x.com"]}
+    both = {"customer_id": "both", "phone_keys": ["333"], "email_keys": ["b@x.com"]}
+
+    primary, new_keys = _pick_customer([by_email, by_phone], "111", "e@x.com")
+    assert primary["customer_id"] == "phone"
+    # The email already belongs to another customer, so it is not copied over
+    assert new_keys == {}
+
+    primary, new_keys = _pick_customer([both], "333", "new@x.com")
+    assert primary["customer_id"] == "both"
+    assert new_keys == {"email_keys": "new@x.com"}
+
+
+def enquiry(enquiry_id, created, status="new", phone="9876543210", email="a@x.com"):
+    return {
+        "enquiry_id": enquiry_id, "name": "Asha", "phone": phone, "email": email,
+        "status": status, "event_type": "Wedding", "event_date": "2026-12-01",
+        "created_at": created.isoformat(), "created_at_dt": created,
+    }
+
+
+def test_replaying_older_enquiries_keeps_the_latest():
+    async def scenario():
+        customers = MemoryRepositories().customers
+        newest = enquiry("new", datetime(2026, 3, 1, tzinfo=timezone.utc))
+        oldest = enquiry("old", datetime(2025, 1, 1, tzinfo=timezone.utc), status="closed")
+        customer_id = await customers.record_enquiry(newest, "9876543210", "a@x.com")
+        assert await customers.record_enquiry(oldest, "9876543210", "a@x.com") == customer_id
+
+        await customers.update_status("new", "contacted")
+        return await customers.get(customer_id)
+
+    customer = asyncio.run(scenario())
+    assert customer["submission_count"] == 2
+    assert customer["latest_enquiry_id"] == "new"
+    assert customer["latest_status"] == "contacted"
+    assert customer["first_enquiry_at"].startswith("2025-01-01")
+
+
+def test_grouped_enquiries_endpoint(client, admin_headers):
+    submission = {
+        "name": "Ravi", "email": "Ravi@Example.com", "phone": "+91 90000 00001",
+        "event_type": "Wedding", "event_date": "2026-11-20", "location": "Pune", "message": "Hi",
+    }
+    first = client.post("/api/enquiries", json=submission).json()
+    second = client.post("/api/enquiries", json={**submission, "email": "ravi@example.com", "phone": "09000000001", "message": "Again"}).json()
+    assert first["customer_id"] == second["customer_id"]
+
+    client.patch(f"/api/enquiries/{second['enquiry_id']}", json={"status": "contacted"}, headers=admin_headers)
+
+    customers = client.get("/api/enquiries/customers", headers=admin_headers).json()
+    customer = next(row for row in customers if row["customer_id"] == first["customer_id"])
+    assert customer["submission_count"] == 2
+    assert customer["latest_enquiry_id"] == second["enquiry_id"]
+    assert customer["latest_status"] == "contacted"
+
+    detail = client.get(f"/api/enquiries/customers/{customer['customer_id']}", headers=admin_headers).json()
+    assert [row["enquiry_id"] for row in detail["enquiries"]] == [second["enquiry_id"], first["enquiry_id"]]
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def events(client, admin_headers):
+    from server import repos
+
+    repos.events.records.clear()
+    created = []
+    for title, date in [("Garden Wedding", "2024-02-10"), ("Palace Wedding", "2025-03-15")]:
+        event = {
+            "title": title, "category": "wedding", "event_type": "Outdoor", "location": "Pune",
+            "date": date, "images": ["a.jpg", "b.jpg"], "description": "...",
+        }
+        response = client.post("/api/events", json=event, headers=admin_headers)
+        assert response.status_code == 200
+        created.append(response.json())
+    return created
+
+
+def test_event_summaries_are_compact(client, events):
+    summaries = client.get("/api/events", params={"category": "wedding", "date_from": "2025-01-01"}).json()
+    assert [summary["title"] for summary in summaries] == ["Palace Wedding"]
+    assert summaries[0]["cover_image"] == "a.jpg"
+    assert summaries[0]["image_count"] == 2
+    assert "images" not in summaries[0]
+
+
+def test_event_detail(client, events):
+    event_id = events[0]["event_id"]
+    detail = client.get(f"/api/events/{event_id}").json()
+    assert detail["images"] == ["a.jpg", "b.jpg"]
+    assert client.get("/api/events/missing").status_code == 404
+
+
+def test_admin_event_read_bypasses_the_cache(client, admin_headers, events):
+    event_id = events[0]["event_id"]
+    assert client.get(f"/api/events/{event_id}").json()["title"] == "Garden Wedding"
+
+    # A write handled by another worker leaves this worker's cache untouched
+    from server import repos
+    asyncio.run(repos.events.update(event_id, {"title": "Renamed"}))
+
+    assert client.get(f"/api/events/{event_id}").json()["title"] == "Garden Wedding"
+    assert client.get(f"/api/admin/events/{event_id}", headers=admin_headers).json()["title"] == "Renamed"
+
+
+def test_admin_event_list_bypasses_the_cache(client, admin_headers, events):
+    event_id = events[1]["event_id"]
+    assert client.get("/api/events").status_code == 200
+    assert client.get("/api/admin/events").status_code in (401, 403)
+
+    from server import repos
+    asyncio.run(repos.events.update(event_id, {"description": "Updated elsewhere"}))
+
+    summaries = {summary["event_id"]: summary for summary in client.get("/api/admin/events", headers=admin_headers).json()}
+    assert summaries[event_id]["description"] == "Updated elsewhere"
+    assert summaries[event_id]["event_type"] == "Outdoor"
+    assert "images" not in summaries[event_id]
@@ -0,0 +1,33 @@
+import asyncio
+import time
+
+import server
+
+
+def test_ready_after_warm_up(client):
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["index_failures"] == []
+
+
+def test_probes_do_not_wait_for_warm_up_retries(client, monkeypatch):
+    attempts = []
+
+    async def slow_warm_up():
+        attempts.append(time.perf_counter())
+        await asyncio.sleep(0.3)
+        server.app_state["ready"] = True
+
+    monkeypatch.setattr(server, "warm_up", slow_warm_up)
+    monkeypatch.setitem(server.app_state, "ready", False)
+
+    started = time.perf_counter()
+    statuses = [client.get("/health/ready").status_code for _ in range(3)]
+    assert statuses == [503, 503, 503]
+    assert time.perf_counter() - started < 0.3
+    # Overlapping probes share a single background retry
+    assert len(attempts) == 1
+
+    time.sleep(0.4)
+    assert client.get("/health/ready").status_code == 200
+    assert client.get("/health/live").status_code == 200
@@ -0,0 +1,110 @@
+"""
+Contract tests for the data-access layer, run against the in-memory backend
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from repositories import DuplicateRecordError, MemoryRepositories
+
+
+@pytest.fixture
+def repos():
+    return MemoryRepositories()
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_event_crud(repos):
+    event = {"event_id": "e1", "title": "Wedding", "category": "wedding", "images": ["a.jpg"]}
+    run(repos.events.insert(event))
+    with pytest.raises(DuplicateRecordError):
+        run(repos.events.insert(event))
+
+    assert run(repos.events.push_images("e1", ["b.jpg"]))
+    assert run(repos.events.update("e1", {"title": "Renamed"}))
+    assert run(repos.events.get("e1"))["images"] == ["a.jpg", "b.jpg"]
+    assert run(repos.events.get("e1"))["title"] == "Renamed"
+
+    assert run(repos.events.delete("e1"))
+    assert run(repos.events.get("e1")) is None
+    assert not run(repos.events.update("e1", {"title": "Gone"}))
+
+
+def test_reads_return_copies(repos):
+    run(repos.events.insert({"event_id": "e1", "images": ["a.jpg"]}))
+    run(repos.events.get("e1"))["images"].append("mutated.jpg")
+    assert run(repos.events.get("e1"))["images"] == ["a.jpg"]
+
+
+def test_enquiry_date_ranges_and_stats(repos):
+    for index, (created, status) in enumerate([(datetime(2026, 1, 5), "new"), (datetime(2026, 2, 5), "new"), (datetime(2026, 2, 9), "closed")]):
+        run(repos.enquiries.insert({
+            "enquiry_id": f"q{index}", "status": status,
+            "created_at_dt": created.replace(tzinfo=timezone.utc),
+        }))
+
+    february = (datetime(2026, 2, 1, tzinfo=timezone.utc), datetime(2026, 3, 1, tzinfo=timezone.utc))
+    assert [doc["enquiry_id"] for doc in run(repos.enquiries.list(created_range=february))] == ["q2", "q1"]
+
+    stats = run(repos.enquiries.stats())
+    assert stats["total"] == 3
+    assert stats["by_status"] == {"new": 2, "closed": 1}
+    assert stats["by_month"] == [{"month": "2026-02", "count": 2}, {"month": "2026-01", "count": 1}]
+
+
+def test_content_save_version_is_optimistic(repos):
+    record = {"section_name": "about", "version": 1, "patch": [], "revert": []}
+    assert run(repos.content.save_version(None, {"title": "One"}, record))
+    # A second first-save loses instead of overwriting
+    assert not run(repos.content.save_version(None, {"title": "Other"}, record))
+
+    current = run(repos.content.get("about"))
+    assert run(repos.content.save_version(current, {"title": "Two"}, {**record, "version": 2}))
+    assert not run(repos.content.save_version(current, {"title": "Stale"}, {**record, "version": 2}))
+    assert run(repos.content.get("about"))["content"] == {"title": "Two"}
+    assert [version["version"] for version in run(repos.content.list_versions("about"))] == [2, 1]
+
+
+def test_upload_sessions_claim_once_and_expire(repos):
+    now = datetime.now(timezone.utc)
+    run(repos.uploads.insert({"session_id": "live", "status": "open", "expires_at": now + timedelta(minutes=5)}))
+    run(repos.uploads.insert({"session_id": "expired", "status": "open", "expires_at": now - timedelta(seconds=1)}))
+
+    assert run(repos.uploads.get("expired")) is None
+    assert run(repos.uploads.claim("live", {"urls": ["a.jpg"]}))
+    assert not run(repos.uploads.claim("live", {"urls": ["b.jpg"]}))
+    run(repos.uploads.reopen("live"))
+    assert run(repos.uploads.claim("live", {"urls": ["b.jpg"]}))
+
+
+def test_notification_outbox(repos):
+    now = datetime.now(timezone.utc)
+    for notification_id, status, due in [("due", "pending", now), ("later", "pending", now + timedelta(hours=1)), ("sent", "sent", now)]:
+        run(repos.notifications.insert({
+            "notification_id": notification_id, "status": status,
+            "next_attempt_at": due, "updated_at": now - timedelta(days=40),
+        }))
+
+    assert [doc["notification_id"] for doc in run(repos.notifications.due(now, 10))] == ["due"]
+    assert run(repos.notifications.purge(now - timedelta(days=30))) == 1
+    assert run(repos.notifications.update("due", {"status": "sent"}))
+
+
+def test_leases_are_exclusive_until_released(repos):
+    assert run(repos.leases.acquire("leader", "a", 30))
+    assert not run(repos.leases.acquire("leader", "b", 30))
+    assert run(repos.leases.acquire("leader", "a", 30))
+    run(repos.leases.release("leader", "b"))
+    assert not run(repos.leases.acquire("leader", "b", 30))
+    run(repos.leases.release("leader", "a"))
+    assert run(repos.leases.acquire("leader", "b", 30))
+
+
+def test_calls_are_instrumented(repos):
+    run(repos.events.get("missing"))
+    operations = {(row["collection"], row["operation"]) for row in repos.instrumentation.snapshot()}
+    assert ("events", "get") in operations
@@ -0,0 +1,105 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from repositories import MemoryRepositories
+from scheduler import CronTrigger, IntervalTrigger, Scheduler
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("expression, after, expected", [
+    ("30 3 * * *", utc(2026, 1, 1, 2, 0), utc(2026, 1, 1, 3, 30)),
+    ("30 3 * * *", utc(2026, 1, 1, 3, 30), utc(2026, 1, 2, 3, 30)),
+    ("*/15 * * * *", utc(2026, 1, 1, 10, 7, 42), utc(2026, 1, 1, 10, 15)),
+    ("0 9-17/4 * * *", utc(2026, 1, 1, 13, 1), utc(2026, 1, 1, 17, 0)),
+    ("0 0 1 * *", utc(2026, 1, 31, 12, 0), utc(2026, 2, 1, 0, 0)),
+    ("0 0 29 2 *", utc(2026, 3, 1), utc(2028, 2, 29)),
+    # 2026-01-05 is a Monday
+    ("0 12 * * 1", utc(2026, 1, 1), utc(2026, 1, 5, 12, 0)),
+    ("0 12 * * 7", utc(2026, 1, 1), utc(2026, 1, 4, 12, 0)),
+    # Day-of-month and day-of-week both restricted: either matches
+    ("0 0 15 * 1", utc(2026, 1, 1), utc(2026, 1, 5)),
+])
+def test_cron_next_run(expression, after, expected):
+    assert CronTrigger(expression).next_run(after) == expected
+
+
+@pytest.mark.parametrize("expression", ["* * * *", "60 * * * *", "* * * * 8", "*/0 * * * *", "5-1 * * * *", "0 0 31 2 *"])
+def test_cron_rejects_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronTrigger(expression).next_run(utc(2026, 1, 1))
+
+
+def test_interval_trigger():
+    assert IntervalTrigger(90).next_run(utc(2026, 1, 1)) == utc(2026, 1, 1, 0, 1, 30)
+    with pytest.raises(ValueError):
+        IntervalTrigger(0)
+
+
+def test_leader_only_jobs_run_on_one_instance():
+    async def scenario():
+        leases = MemoryRepositories().leases
+        runs = []
+        schedulers = []
+        for name in ("first", "second"):
+            scheduler = Scheduler(leases=leases, lease_ttl_seconds=0.3, tick_seconds=0.01)
+
+            async def job(name=name):
+                runs.append(name)
+
+            scheduler.add_job("leader-job", job, IntervalTrigger(0.02), leader_only=True)
+            schedulers.append(scheduler)
+
+        await schedulers[0].start()
+        await asyncio.sleep(0.02)
+        await schedulers[1].start()
+        await asyncio.sleep(0.2)
+        assert set(runs) == {"first"}
+
+        # The second instance takes over once the leader releases its lease
+        await schedulers[0].stop()
+        await asyncio.sleep(0.3)
+        await schedulers[1].stop()
+        return runs
+
+    runs = asyncio.run(scenario())
+    assert runs[-1] == "second"
+
+
+def test_job_failures_are_recorded():
+    async def scenario():
+        scheduler = Scheduler()
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        scheduler.add_job("failing", failing, IntervalTrigger(60))
+        await scheduler.run_job("failing")
+        return scheduler.metrics()["jobs"][0]
+
+    metrics = asyncio.run(scenario())
+    assert metrics["runs"] == 1
+    assert metrics["failures"] == 1
+    assert metrics["last_error"] == "boom"
+
+
+def test_cache_refresh_overwrites_without_a_miss_window(client, monkeypatch):
+    import server
+
+    seen = []
+    real_list = server.repos.services.list
+
+    async def observing_list():
+        # Runs mid-refresh: the old entry must still be served
+        seen.append(server.service_cache.get("*"))
+        return await real_list()
+
+    client.get("/api/services")
+    monkeypatch.setattr(server.repos.services, "list", observing_list)
+    asyncio.run(server.refresh_public_caches())
+    assert seen and seen[0] is not None
+    assert server.service_cache.get("*") is not None
@@ -0,0 +1,53 @@
+import pytest
+
+
+EVENTS = [
+    {"title": "Garden Wedding", "category": "wedding", "event_type": "Outdoor", "location": "Pune", "date": "2024-02-10"},
+    {"title": "Palace Wedding", "category": "wedding", "event_type": "Indoor", "location": "Jaipur", "date": "2025-03-15"},
+    {"title": "Sangeet Night", "category": "sangeet", "event_type": "Indoor", "location": "Pune", "date": "2025-06-01"},
+    {"title": "Haldi Morning", "category": "haldi", "event_type": "Outdoor", "location": "Pune", "date": "2025-07-20"},
+]
+
+
+@pytest.fixture(scope="module")
+def showcase_events(client, admin_headers):
+    from server import repos
+
+    # Start from an empty event store so the facet counts are exact
+    repos.events.records.clear()
+    created = []
+    for event in EVENTS:
+        response = client.post("/api/events", json={**event, "images": ["a.jpg", "b.jpg"], "description": "..."}, headers=admin_headers)
+        assert response.status_code == 200
+        created.append(response.json())
+    return created
+
+
+def facet_counts(showcase, facet):
+    return {row["value"]: row["count"] for row in showcase["facets"][facet]}
+
+
+def test_facets_count_against_the_other_filters(client, showcase_events):
+    showcase = client.get("/api/showcase", params={"location": "Pune"}).json()
+    assert showcase["total"] == 3
+    assert facet_counts(showcase, "category") == {"wedding": 1, "sangeet": 1, "haldi": 1}
+    # A facet ignores its own filter so every location stays selectable
+    assert facet_counts(showcase, "location") == {"Pune": 3, "Jaipur": 1}
+    assert facet_counts(showcase, "year") == {2025: 2, 2024: 1}
+
+
+def test_showcase_paging(client, showcase_events):
+    first = client.get("/api/showcase", params={"limit": 3}).json()
+    second = client.get("/api/showcase", params={"skip": 3, "limit": 3}).json()
+    assert first["total"] == second["total"] == 4
+    assert len(first["events"]) == 3 and len(second["events"]) == 1
+    # Newest first
+    assert first["events"][0]["title"] == "Haldi Morning"
+
+
+def test_showcase_projection_drops_heavy_fields():
+    from repositories import SHOWCASE_PROJECTION
+
+    assert "description" not in SHOWCASE_PROJECTION and "images" not in SHOWCASE_PROJECTION
+    # Everything the facets group on must survive the projection
+    assert {"category", "event_type", "location", "date_dt"} <= set(SHOWCASE_PROJECTION)
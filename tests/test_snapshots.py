@@ -0,0 +1,71 @@
+import asyncio
+import time
+
+from snapshots import MANIFEST_NAME, SnapshotPublisher
+
+
+def test_publish_writes_hashed_files_and_manifest(tmp_path):
+    async def render():
+        return {"services": [{"title": "Decor"}], "content/about": {"title": "About"}}
+
+    publisher = SnapshotPublisher(tmp_path, render)
+    manifest = asyncio.run(publisher.publish())
+
+    assert manifest["version"] == 1
+    for entry in manifest["files"].values():
+        assert (tmp_path / entry["file"]).exists()
+        assert (tmp_path / (entry["file"] + ".gz")).exists()
+    # Republishing unchanged payloads keeps the version
+    assert asyncio.run(publisher.publish())["version"] == 1
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_schedule_never_cancels_a_running_publish(tmp_path):
+    renders = []
+
+    async def render():
+        renders.append(len(renders))
+        await asyncio.sleep(0.05)
+        return {"services": [len(renders)]}
+
+    async def scenario():
+        publisher = SnapshotPublisher(tmp_path, render, debounce_seconds=0.01)
+        publisher.schedule()
+        while not renders:
+            await asyncio.sleep(0.005)
+        # Arrives mid-publish: must queue a second publish, not cancel the first
+        publisher.schedule()
+        await asyncio.sleep(0.3)
+        return publisher.read_manifest()
+
+    manifest = asyncio.run(scenario())
+    assert len(renders) == 2
+    assert manifest["version"] == 2
+
+
+def test_cancelled_publish_waits_for_the_writer_thread(tmp_path):
+    finished = []
+
+    class SlowPublisher(SnapshotPublisher):
+        def _write_snapshot(self, payloads):
+            time.sleep(0.1)
+            finished.append(True)
+            return super()._write_snapshot(payloads)
+
+    async def render():
+        return {"services": []}
+
+    async def scenario():
+        publisher = SlowPublisher(tmp_path, render)
+        task = asyncio.create_task(publisher.publish())
+        await asyncio.sleep(0.02)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        # The lock is only released once the writer is done
+        return bool(finished), publisher._lock.locked()
+
+    assert asyncio.run(scenario()) == (True, False)
+    assert (tmp_path / MANIFEST_NAME).exists()
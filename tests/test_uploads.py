@@ -0,0 +1,38 @@
+import pytest
+
+import server
+
+
+@pytest.fixture
+def cloud(monkeypatch):
+    monkeypatch.setenv("CLOUDINARY_CLOUD_NAME", "demo")
+    monkeypatch.setenv("CLOUDINARY_API_KEY", "key")
+    monkeypatch.setattr(server.cloudinary_signer, "sign", lambda params: "signature")
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://res.cloudinary.com/demo/image/upload/v1712/ambica-wedding/s-0.jpg", ("image", "ambica-wedding/s-0")),
+    ("https://res.cloudinary.com/demo/video/upload/ambica-wedding/s-1.mp4", ("video", "ambica-wedding/s-1")),
+    ("https://res.cloudinary.com/other/image/upload/v1/ambica-wedding/s-0.jpg", None),
+    ("https://res.cloudinary.com/demo/image/upload/v1/x.jpg?s-0", None),
+    ("http://res.cloudinary.com/demo/image/upload/v1/ambica-wedding/s-0.jpg", None),
+    ("https://evil.example/demo/image/upload/v1/ambica-wedding/s-0.jpg", None),
+])
+def test_cloudinary_asset(cloud, url, expected):
+    assert server.cloudinary_asset(url) == expected
+
+
+def test_complete_session_matches_exact_public_ids(client, admin_headers, cloud):
+    session = client.post("/api/cloudinary/upload-session", json={"count": 2}, headers=admin_headers).json()
+    base = f"https://res.cloudinary.com/demo/image/upload/v1/{session['folder']}"
+    first, second = (f"{base}/{upload['public_id']}.jpg" for upload in session["uploads"])
+    complete = f"/api/cloudinary/upload-session/{session['session_id']}/complete"
+
+    # The session id appearing elsewhere in the URL is not enough
+    smuggled = f"https://res.cloudinary.com/demo/image/upload/v1/other/{session['uploads'][0]['public_id']}x.jpg"
+    assert client.post(complete, json={"urls": [smuggled]}, headers=admin_headers).status_code == 400
+    assert client.post(complete, json={"urls": [first, first]}, headers=admin_headers).status_code == 400
+    assert client.post(complete, json={"urls": [first, second, second]}, headers=admin_headers).status_code == 400
+
+    assert client.post(complete, json={"urls": [first, second]}, headers=admin_headers).status_code == 200
+    assert client.post(complete, json={"urls": [first, second]}, headers=admin_headers).status_code == 409